@@ -8,60 +8,90 @@ Features included:
 - get_current_user dependency to protect routes (demonstration)
 """
 
-from datetime import datetime, timedelta
-from typing import Dict
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set
+
+from cachetools import TTLCache
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from passlib.context import CryptContext
-from jose import jwt, JWTError
+from jwt import InvalidTokenError as JWTError
 from pydantic import BaseModel
 
 from odmantic import ObjectId
-from pymongo.errors import DuplicateKeyError
-
-from app.core.config import settings
-from app.db.session import engine
-from app.domains.users.schemas import UserCreate, UserLogin, UserModel, usermodel_to_public, UserPublic
+from odmantic.exceptions import DuplicateKeyError  # engine.save wraps pymongo's DuplicateKeyError in this
+
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
+from app.core.responses import ORJSONUTCResponse
+from app.db.session import engine, users_coll
+from app.domains.users.schemas import (
+    UserCreate,
+    UserLogin,
+    UserModel,
+    UserPublic,
+    usermodel_to_public_dict,
+)
+from app.domains.users.services import USER_LIGHT_PROJECTION, get_user_light
+
+logger = logging.getLogger(__name__)
 
 # Router for this module
 router = APIRouter(prefix="/api/v1/auth", tags=["auth"])
 
-# Password hashing context: bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 scheme for FastAPI dependency (token passed in Authorization: Bearer <token>)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Short-lived cache of resolved tokens: raw token -> (exp, user).
+# Skips jwt.decode and the Mongo lookup for chatty clients; bounded in size and staleness (60s).
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
 
-# -------------------------
-# Token helpers
-# -------------------------
-def create_access_token(subject: str, expires_delta: timedelta = None) -> str:
-    """
-    Create a JWT token encoding the `subject` (usually user id as string).
-    We use HS256 and settings.JWT_SECRET. Expiry is set by ACCESS_TOKEN_EXPIRE_MINUTES.
-    """
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
-    payload = {"sub": subject, "exp": expire}
-    token = jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
-    return token
+# Projections for the auth hot path
+_LOGIN_PROJECTION = {"_id": 1, "email": 1, "password_hash": 1, "last_login": 1}
+# Skip fields UserPublic never serializes (embeddings can be several KB)
+_CURRENT_USER_PROJECTION = {**USER_LIGHT_PROJECTION, "onboarding": 0, "consent": 0}
 
+# last_login is only rewritten when older than this (bursts of logins -> one write)
+LAST_LOGIN_RESOLUTION = timedelta(seconds=60)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plaintext password against its bcrypt hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+# Strong references to fire-and-forget tasks so they are not garbage-collected mid-flight
+_background_tasks: Set[asyncio.Task] = set()
 
 
-def get_password_hash(password: str) -> str:
-    """Hash password using bcrypt; return hashed string for DB storage."""
-    return pwd_context.hash(password)
+async def _record_login(user_id: ObjectId, rehash_password: Optional[str] = None) -> None:
+    """
+    Background write after a successful login: set last_login and, if given,
+    store a fresh argon2id hash of `rehash_password` (legacy bcrypt migration).
+    """
+    try:
+        updates = {"last_login": datetime.now(timezone.utc)}
+        if rehash_password is not None:
+            updates["password_hash"] = await get_password_hash(rehash_password)
+        await users_coll.update_one({"_id": user_id}, {"$set": updates})
+    except Exception as exc:
+        logger.warning("Could not record login for user_id=%s: %s", user_id, exc)
 
 
 # -------------------------
 # Auth endpoints
 # -------------------------
-@router.post("/signup", response_model=UserPublic, status_code=status.HTTP_201_CREATED)
+# response_model=None: the UserPublic body is built from trusted data and returned as a ready
+# response, so FastAPI's response re-validation is skipped; `responses` keeps the schema in the OpenAPI docs.
+@router.post(
+    "/signup",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": UserPublic}},
+)
 async def signup(payload: UserCreate):
     """
     Sign up new user.
@@ -70,7 +100,7 @@ async def signup(payload: UserCreate):
     - Create unique index on email at app startup (see main.py); here handle duplicate key errors gracefully.
     """
     # Hash password BEFORE creating DB model
-    password_hash = get_password_hash(payload.password)
+    password_hash = await get_password_hash(payload.password)
 
     # Build the Odmantic model
     user = UserModel(
@@ -91,7 +121,7 @@ async def signup(payload: UserCreate):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not create user")
 
     # Return public projection (no password_hash)
-    return usermodel_to_public(saved)
+    return ORJSONUTCResponse(usermodel_to_public_dict(saved), status_code=status.HTTP_201_CREATED)
 
 
 # Token response schema
@@ -108,20 +138,25 @@ async def login(payload: UserLogin):
     - Verify password.
     - Return JWT access token with 'sub' = user_id (string).
     """
-    # Find user by email
-    user = await engine.find_one(UserModel, UserModel.email == payload.email)
-    if not user:
-        # Generic message to avoid leaking existence
+    # Find user by email; only the fields needed to authenticate (raw dict, no model validation)
+    user_doc = await users_coll.find_one({"email": payload.email}, projection=_LOGIN_PROJECTION)
+    if not user_doc:
+        # Same hashing cost as a real user, and a generic message, to avoid leaking existence
+        await verify_password(payload.password, DUMMY_PASSWORD_HASH)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    if not verify_password(payload.password, user.password_hash):
+    if not await verify_password(payload.password, user_doc["password_hash"]):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    # (Optional) update last_login timestamp
-    user.last_login = datetime.utcnow()
-    await engine.save(user)
+    # Record last_login (and migrate legacy bcrypt hashes) off the response path
+    needs_rehash = password_needs_rehash(user_doc["password_hash"])
+    last_login = user_doc.get("last_login")
+    if needs_rehash or last_login is None or datetime.now(timezone.utc) - last_login > LAST_LOGIN_RESOLUTION:
+        task = asyncio.create_task(_record_login(user_doc["_id"], payload.password if needs_rehash else None))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
-    access_token = create_access_token(subject=str(user.id))
+    access_token = create_access_token(subject=str(user_doc["_id"]))
     return TokenResponse(access_token=access_token)
 
 
@@ -131,38 +166,44 @@ async def login(payload: UserLogin):
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserModel:
     """
     Decode JWT token, fetch user from DB, and return UserModel instance.
+    The user is loaded without the fields UserPublic does not expose, so never engine.save() it.
+    Resolved tokens are cached for up to 60s (never past their own expiry).
     Raises HTTPException on failure conditions.
     """
+    cached = _token_cache.get(token)
+    if cached is not None:
+        exp, cached_user = cached
+        if exp > time.time():
+            return cached_user
+        _token_cache.pop(token, None)
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        payload = decode_access_token(token)
         user_id = payload.get("sub")
-        if user_id is None:
+        exp = payload.get("exp")
+        if user_id is None or exp is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    # Convert to ObjectId when querying (Odmantic uses ObjectId for model.id)
-    try:
-        oid = ObjectId(user_id)
-    except Exception:
-        raise credentials_exception
-
-    user = await engine.find_one(UserModel, UserModel.id == oid)
+    # None for a malformed id or a deleted user
+    user = await get_user_light(user_id, projection=_CURRENT_USER_PROJECTION)
     if user is None:
         raise credentials_exception
 
+    _token_cache[token] = (exp, user)
     return user
 
 
 # Example protected route demonstrating dependency usage (optional)
-@router.get("/me", response_model=UserPublic)
+@router.get("/me", response_model=None, responses={status.HTTP_200_OK: {"model": UserPublic}})
 async def me(current_user: UserModel = Depends(get_current_user)):
     """
     Protected endpoint returning current user's public profile.
     """
-    return usermodel_to_public(current_user)
+    return ORJSONUTCResponse(usermodel_to_public_dict(current_user))
@@ -1,24 +1,24 @@
 # app/api/v1/endpoints/dreams.py
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Form, Header
 from typing import List, Optional
-from datetime import datetime
-import os
 import jwt  # PyJWT
-import json
+import secrets
 from pathlib import Path
 import logging
-from datetime import timezone
+
+import aiofiles
 
 # Import domain services & models
-from app.domains.dreams.schemas import DreamCreate, DreamDB, dreammodel_to_dto
+from app.domains.dreams.schemas import DreamCreate, DreamDB, dreammodel_to_dto, serialize_dreams
 from app.domains.dreams.services import (
     create_dream as svc_create_dream,
     list_dreams_for_user as svc_list_dreams_for_user,
     get_dream_by_id as svc_get_dream_by_id,
-    analyze_dream_background as svc_analyze_dream_background,
 )
-from app.core.config import settings  # optional if you use settings; falls back to env
-from fastapi.responses import JSONResponse
+from app.domains.dreams.tasks import enqueue_dream_analysis
+from app.core.config import settings
+from app.core.security import decode_access_token
+from fastapi.responses import JSONResponse, Response
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
@@ -29,9 +29,6 @@ router = APIRouter(prefix="/api/v1/dreams", tags=["dreams"])
 # -------------------------
 # Auth dependency
 # -------------------------
-JWT_SECRET = os.getenv("JWT_SECRET", getattr(settings, "JWT_SECRET", None))
-JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", getattr(settings, "JWT_ALGORITHM", "HS256"))
-
 async def get_current_user(authorization: Optional[str] = Header(None), x_user_id: Optional[str] = Header(None)):
     """
     Resolve the current user id.
@@ -47,9 +44,7 @@ async def get_current_user(authorization: Optional[str] = Header(None), x_user_i
         scheme, token = authorization.split()
         if scheme.lower() != "bearer":
             raise HTTPException(status_code=401, detail="Authorization scheme must be Bearer")
-        if not JWT_SECRET:
-            raise HTTPException(status_code=500, detail="Server missing JWT_SECRET configuration")
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = decode_access_token(token)
         user_id = payload.get("sub")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token - missing sub")
@@ -64,19 +59,23 @@ async def get_current_user(authorization: Optional[str] = Header(None), x_user_i
 # -------------------------
 # File helpers (dev local upload)
 # -------------------------
-UPLOAD_FOLDER = os.getenv("UPLOAD_FOLDER", "./uploads")
+UPLOAD_FOLDER = settings.UPLOAD_FOLDER
 Path(UPLOAD_FOLDER).mkdir(parents=True, exist_ok=True)
 
-def save_upload_file_local(upload_file: UploadFile) -> str:
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+async def save_upload_file_local(upload_file: UploadFile) -> str:
     """
     Save uploaded file to local folder (development). For production, replace with GCS upload and return gs:// URI.
+    Streams in UPLOAD_CHUNK_SIZE chunks so memory stays constant and the event loop is never blocked on disk IO.
     Returns filepath string.
     """
-ts = int(datetime.now(timezone.utc).timestamp() * 1000)    
-safe_name = f"{ts}_{upload_file.filename}"
+    # Random prefix: collision-free under concurrent uploads; basename only, so no path traversal
+    safe_name = f"{secrets.token_urlsafe(12)}_{Path(upload_file.filename or 'audio').name}"
     dest = Path(UPLOAD_FOLDER) / safe_name
-    with dest.open("wb") as f:
-        f.write(upload_file.file.read())
+    async with aiofiles.open(dest, "wb") as f:
+        while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
     return str(dest)
 
 # -------------------------
@@ -96,19 +95,18 @@ async def create_dream_endpoint(
     - **audio**: An optional audio file.
     """
     try:
-        # Parse the JSON string from the form field and validate with Pydantic
-        payload_data = json.loads(payload_str)
-        payload = DreamCreate.model_validate(payload_data)
-    except json.JSONDecodeError:
-        raise HTTPException(status_code=400, detail="Invalid JSON format in 'payload' form field.")
+        # Parse + validate in one pass inside pydantic-core (no intermediate Python dict)
+        payload = DreamCreate.model_validate_json(payload_str)
     except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            raise HTTPException(status_code=400, detail="Invalid JSON format in 'payload' form field.")
         raise HTTPException(status_code=422, detail=f"Validation error in payload: {e}")
 
     audio_url = None
     audio_duration = None
     if audio:
         # DEV: save local file; PRODUCTION: replace with GCS upload and set audio_url to gs://bucket/obj
-        audio_url = save_upload_file_local(audio)
+        audio_url = await save_upload_file_local(audio)
 
     dream = await svc_create_dream(user_id=current_user["user_id"], payload=payload, audio_url=audio_url, audio_duration=audio_duration)
     
@@ -119,8 +117,8 @@ async def create_dream_endpoint(
 @router.get("/me", response_model=List[DreamDB])
 async def list_my_dreams(limit: int = 50, skip: int = 0, current_user = Depends(get_current_user)):
     docs = await svc_list_dreams_for_user(current_user["user_id"], limit=limit, skip=skip)
-    # UPDATED: Simplified by using the DTO converter in a list comprehension
-    return [dreammodel_to_dto(d) for d in docs]
+    # Encoded directly with msgspec (response_model documents the shape; no per-item DTO)
+    return Response(content=serialize_dreams(docs), media_type="application/json")
 
 
 @router.get("/{dream_id}", response_model=DreamDB)
@@ -139,16 +137,16 @@ async def get_dream(dream_id: str, current_user = Depends(get_current_user)):
 async def analyze_dream_endpoint(dream_id: str, background_tasks: BackgroundTasks, current_user = Depends(get_current_user)):
     """
     Trigger analysis for a dream via Vertex AI + Speech-to-Text.
-    This endpoint schedules the work as a background task and returns 202 Accepted.
+    This endpoint enqueues the work (arq queue, or a background task without REDIS_URL) and returns 202 Accepted.
 
     Behavior:
       - If dream has text_content: analyze that text.
       - Else if dream.audio_url is a gs:// URI: transcribe with Speech-to-Text then analyze.
       - Else returns 422 if neither text nor GCS audio present.
 
-    The actual analysis is performed in svc_analyze_dream_background which updates the DB document.
+    The actual analysis is performed by analyze_dream_background / analyze_dreams_batch, which update the DB document.
     """
-    logger.info(f"analyze_dream_endpoint: dream_id={dream_id}")
+    logger.info("analyze_dream_endpoint: dream_id=%s", dream_id)
     dream = await svc_get_dream_by_id(dream_id)
     if dream is None:
         raise HTTPException(status_code=404, detail="Dream not found")
@@ -167,6 +165,6 @@ async def analyze_dream_endpoint(dream_id: str, background_tasks: BackgroundTask
             detail="No text or GCS audio available for analysis. Provide text_content or a 'gs://' audio_url."
         )
 
-    # schedule background analysis (non-blocking)
-    background_tasks.add_task(svc_analyze_dream_background, str(dream.id))
+    # schedule analysis (non-blocking)
+    await enqueue_dream_analysis(str(dream.id), background_tasks)
     return JSONResponse(status_code=202, content={"status": "accepted", "dream_id": str(dream.id)})
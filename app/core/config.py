@@ -1,8 +1,11 @@
 """
 Application configuration using Pydantic BaseSettings.
 Reads configuration from environment variables (12-factor style).
+This is the single source of settings; import `settings` (or call `get_settings()`).
 """
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import Optional
@@ -11,13 +14,26 @@ class Settings(BaseSettings):
     # MongoDB connection URI (use a Render/Atlas URI in prod)
     MONGO_URI: str = Field(env="MONGO_URI")
     MONGO_DB: str = Field(env="MONGO_DB")
+    # Motor connection pool: keep warm connections so requests don't pay TCP+TLS setup,
+    # and fail fast (3s) instead of hanging 30s on server selection.
+    MONGO_MAX_POOL_SIZE: int = Field(50, env="MONGO_MAX_POOL_SIZE")
+    MONGO_MIN_POOL_SIZE: int = Field(10, env="MONGO_MIN_POOL_SIZE")
+    MONGO_MAX_IDLE_TIME_MS: int = Field(60_000, env="MONGO_MAX_IDLE_TIME_MS")
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = Field(3000, env="MONGO_SERVER_SELECTION_TIMEOUT_MS")
+    MONGO_COMPRESSORS: str = Field("zstd", env="MONGO_COMPRESSORS")  # wire compression, comma-separated
 
     # JWT (JSON Web Token) settings
     JWT_SECRET: str = Field(..., env="JWT_SECRET")  # must be set in env
     JWT_ALGORITHM: str = Field("HS256", env="JWT_ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(60 * 24 * 7, env="ACCESS_TOKEN_EXPIRE_MINUTES")  # default 1 week
     UPLOAD_FOLDER: str = Field("./uploads", env="UPLOAD_FOLDER")
+    # anyio worker threads for sync deps/handlers and UploadFile IO (anyio default is 40)
+    THREADPOOL_MAX_WORKERS: int = Field(200, env="THREADPOOL_MAX_WORKERS")
     USE_REAL_AI: bool = Field(True, env="USE_REAL_AI")
+    # Debug mode: among other things, keeps the raw LLM output (analysis.raw_response) on stored dreams
+    DEBUG: bool = Field(False, env="DEBUG")
+    # Redis for the persistent analysis queue (arq, see app/worker.py); unset = in-process BackgroundTasks
+    REDIS_URL: Optional[str] = Field(None, env="REDIS_URL")
 
      # --- Optional Google Cloud Settings (Defaults to None if not in .env) ---
     GOOGLE_PROJECT: Optional[str] = Field(None, env="GOOGLE_PROJECT")
@@ -35,5 +51,11 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once per process (.env read + validation); later calls are a cache hit."""
+    return Settings()
+
+
 # Single settings instance imported across the app
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,108 @@
+# app/core/fast_jwt.py
+"""
+Minimal HS256 JWT encode/decode.
+
+HS256 is HMAC-SHA256 over `base64url(header) + "." + base64url(payload)`; hashlib/hmac go
+straight to OpenSSL (SHA-NI / ARMv8 crypto where available) and orjson handles the JSON.
+The header for issued tokens is a precomputed constant, and the keyed HMAC state
+(ipad/opad blocks) is computed once per secret and copied for each token.
+
+Only HS256 is supported; other algorithms go through PyJWT (see app/core/security.py).
+Errors are raised as PyJWT exception types so callers keep a single error-handling path.
+"""
+
+import base64
+import hashlib
+import hmac
+import time
+from functools import lru_cache
+from typing import Any, Dict
+
+import orjson
+from jwt.exceptions import (
+    DecodeError,
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAlgorithmError,
+    InvalidSignatureError,
+)
+
+ALGORITHM = "HS256"
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+# base64url({"alg":"HS256","typ":"JWT"}), identical for every token we issue
+_HEADER_SEGMENT = _b64url_encode(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+
+
+@lru_cache(maxsize=8)
+def _keyed_hmac(secret: str) -> "hmac.HMAC":
+    """HMAC-SHA256 state with the key already absorbed; callers must .copy() it."""
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _sign(signing_input: bytes, secret: str) -> bytes:
+    mac = _keyed_hmac(secret).copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+
+def encode(payload: Dict[str, Any], secret: str) -> str:
+    """Sign `payload` with HS256. Time claims (exp/nbf/iat) must already be ints."""
+    signing_input = _HEADER_SEGMENT + b"." + _b64url_encode(orjson.dumps(payload))
+    signature = _sign(signing_input, secret)
+    return (signing_input + b"." + _b64url_encode(signature)).decode("ascii")
+
+
+def decode(token: str, secret: str) -> Dict[str, Any]:
+    """
+    Verify an HS256 token and return its payload.
+    Checks the signature in constant time, then `exp` / `nbf` when present.
+    """
+    try:
+        raw = token.encode("ascii")
+        if raw.count(b".") != 2:
+            raise DecodeError("Not enough segments")
+        signing_input, _, signature_segment = raw.rpartition(b".")
+        header_segment, _, payload_segment = signing_input.partition(b".")
+
+        # Tokens from other issuers (e.g. PyJWT orders "typ" first) take the slow path
+        if header_segment != _HEADER_SEGMENT:
+            header = orjson.loads(_b64url_decode(header_segment))
+            if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+                raise InvalidAlgorithmError("The specified alg value is not allowed")
+
+        signature = _b64url_decode(signature_segment)
+        expected = _sign(signing_input, secret)
+        if not hmac.compare_digest(signature, expected):
+            raise InvalidSignatureError("Signature verification failed")
+
+        payload = orjson.loads(_b64url_decode(payload_segment))
+    except ValueError as exc:  # binascii.Error, orjson.JSONDecodeError, UnicodeEncodeError
+        raise DecodeError(f"Invalid token: {exc}") from exc
+
+    if not isinstance(payload, dict):
+        raise DecodeError("Invalid payload string: must be a json object")
+
+    now = time.time()
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)):
+            raise DecodeError("Expiration Time claim (exp) must be an integer.")
+        if exp <= now:
+            raise ExpiredSignatureError("Signature has expired")
+    nbf = payload.get("nbf")
+    if nbf is not None:
+        if not isinstance(nbf, (int, float)):
+            raise DecodeError("Not Before claim (nbf) must be an integer.")
+        if nbf > now:
+            raise ImmatureSignatureError("The token is not yet valid (nbf)")
+
+    return payload
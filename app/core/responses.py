@@ -0,0 +1,20 @@
+# app/core/responses.py
+"""
+orjson-backed JSON response used as the app's default response class.
+
+datetime objects are serialized natively by orjson (no per-field .isoformat() in Python);
+UTC datetimes (the Motor client is tz_aware) are emitted with a "Z" suffix; any naive datetime is
+treated as UTC.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONUTCResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
@@ -0,0 +1,123 @@
+# app/core/security.py
+"""
+Password hashing and JWT helpers.
+
+New hashes use Argon2id (argon2-cffi's PasswordHasher directly); legacy bcrypt hashes still
+verify (bcrypt package) and are upgraded on the next successful login.
+Hashing and verification are CPU-bound, so they run in a process pool
+instead of on the event loop; concurrent logins no longer block unrelated requests.
+Tokens are HS256 JWTs signed with settings.JWT_SECRET; HS256 goes through the
+hmac/hashlib fast path in app/core/fast_jwt.py, anything else through PyJWT.
+"""
+
+import os
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from typing import Any, Dict
+
+import bcrypt
+import jwt  # PyJWT
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from app.core import fast_jwt
+from app.core.config import settings
+
+# argon2id for all new hashes (argon2-cffi straight into libargon2, no passlib dispatch layer)
+_PH = PasswordHasher(
+    memory_cost=19456,  # KiB (19 MiB), OWASP baseline for argon2id
+    time_cost=2,
+    parallelism=1,
+)
+_ARGON2_PREFIX = "$argon2"
+_BCRYPT_MAX_BYTES = 72  # bcrypt only ever used the first 72 bytes; newer bcrypt releases reject longer input
+
+# Verified against when a login email doesn't exist, so unknown users cost the same as known ones
+# (no timing oracle, and enumeration probes pay full hashing cost).
+DUMMY_PASSWORD_HASH = _PH.hash("dummy-bootstrap")
+
+# Process pool (not threads): hashing is CPU-bound, processes scale across cores.
+# Workers come from a forkserver (spawn where unavailable), never a plain fork: by the first hash this
+# process already runs Motor monitor and logging threads, and forking a multi-threaded process can deadlock.
+# The forkserver preloads this module, so each worker starts with the hasher already imported.
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _mp_context = multiprocessing.get_context("forkserver")
+    _mp_context.set_forkserver_preload([__name__])
+else:
+    _mp_context = multiprocessing.get_context("spawn")
+_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_mp_context)
+
+
+# -------------------------
+# Pool workers (module-level so they can be pickled)
+# -------------------------
+def _hash(password: str) -> str:
+    return _PH.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    """argon2 hashes via argon2-cffi; anything else is treated as a legacy bcrypt hash."""
+    if hashed_password.startswith(_ARGON2_PREFIX):
+        try:
+            return _PH.verify(hashed_password, plain_password)
+        except VerificationError:  # includes VerifyMismatchError
+            return False
+        except InvalidHashError as exc:
+            raise ValueError("malformed argon2 hash") from exc
+    return bcrypt.checkpw(plain_password.encode()[:_BCRYPT_MAX_BYTES], hashed_password.encode())
+
+
+# -------------------------
+# Public async helpers
+# -------------------------
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plaintext password against its stored hash (off the event loop)."""
+    return await asyncio.get_running_loop().run_in_executor(_pool, _verify, plain_password, hashed_password)
+
+
+async def get_password_hash(password: str) -> str:
+    """Hash password using argon2id (off the event loop); return hashed string for DB storage."""
+    return await asyncio.get_running_loop().run_in_executor(_pool, _hash, password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True if the hash uses a deprecated scheme (bcrypt) or outdated parameters. Cheap, no hashing."""
+    if not hashed_password.startswith(_ARGON2_PREFIX):
+        return True
+    try:
+        return _PH.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
+# -------------------------
+# Token helpers
+# -------------------------
+def create_access_token(subject: str, expires_delta: timedelta = None) -> str:
+    """
+    Create a JWT token encoding the `subject` (usually user id as string).
+    We use HS256 and settings.JWT_SECRET. Expiry is set by ACCESS_TOKEN_EXPIRE_MINUTES.
+    """
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    payload = {"sub": subject, "exp": int(time.time()) + lifetime}  # int exp: no datetime conversion in the encoder
+    if settings.JWT_ALGORITHM == fast_jwt.ALGORITHM:
+        return fast_jwt.encode(payload, settings.JWT_SECRET)
+    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+
+
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Verify signature/expiry and return the token payload.
+    Raises jwt.ExpiredSignatureError / jwt.InvalidTokenError on failure.
+    """
+    if settings.JWT_ALGORITHM == fast_jwt.ALGORITHM:
+        return fast_jwt.decode(token, settings.JWT_SECRET)
+    return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+
+
+def shutdown_executor() -> None:
+    """Stop the hashing pool; called on application shutdown."""
+    _pool.shutdown(wait=False, cancel_futures=True)
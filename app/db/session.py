@@ -6,12 +6,29 @@ Creates an AsyncIOMotorClient and uses it to construct an AIOEngine.
 from odmantic import AIOEngine
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.core.config import settings
+from app.domains.dreams.models import DreamModel
+from app.domains.users.schemas import UserModel
 
 # Create Motor client and Odmantic engine.
-# Use the DB name from settings (MONGO_DB).
-_client = AsyncIOMotorClient(settings.MONGO_URI)
+# Use the DB name from settings (MONGO_DB); pool sizing/timeouts also come from settings.
+_client = AsyncIOMotorClient(
+    settings.MONGO_URI,
+    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+    minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+    maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+    serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    retryWrites=True,
+    compressors=settings.MONGO_COMPRESSORS,
+    # Datetimes come back UTC-aware on every read path, so all endpoints emit the same "Z" format
+    tz_aware=True,
+)
 engine = AIOEngine(client=_client, database=settings.MONGO_DB)
 
+# Raw Motor collection handles, resolved once (engine.get_collection builds a new wrapper per call).
+# Collection names come from the models ("user", "dream").
+users_coll = engine.get_collection(UserModel)
+dreams_coll = engine.get_collection(DreamModel)
+
 
 # Optional helper to get engine in other places if you prefer function API
 def get_engine() -> AIOEngine:
@@ -20,4 +37,5 @@ def get_engine() -> AIOEngine:
 # Usage NOTE:
 # - await engine.save(model_instance)
 # - await engine.find_one(Model, Model.field == value)
-# - engine.get_collection(Model) returns the raw Motor collection for index creation
+# - users_coll / dreams_coll (or engine.get_collection(Model)) are the raw Motor collections,
+#   for projected reads, partial updates and index creation
@@ -0,0 +1,101 @@
+# app/domains/ai_engine/batcher.py
+"""
+Micro-batching for work that is cheaper in groups (e.g. one Mongo find for several dreams).
+
+Concurrent callers submit items to one shared queue. A single worker collects up to `max_batch`
+items (whatever is already queued, then waiting at most `max_wait` seconds for more) and passes
+them to the batch handler in one call. Each batch runs in its own task, so collection never waits
+on a slow batch; every caller waits for the batch containing its item.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BATCH = 8
+DEFAULT_MAX_WAIT = 0.05  # seconds
+
+
+class MicroBatcher(Generic[T]):
+    """Group concurrent `submit(item)` calls into `handler(items)` calls."""
+
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Awaitable[Any]],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ):
+        self._handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Strong references to running batches so they are not garbage-collected mid-flight
+        self._batches: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the worker on the running loop (idempotent)."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the worker and cancel running batches (their callers see CancelledError)."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        for task in list(self._batches):
+            task.cancel()
+        self._batches.clear()
+
+    async def submit(self, item: T) -> None:
+        """Queue `item` and wait until the batch containing it has been handled (or raised)."""
+        self.start()
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, fut))
+        await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[T, asyncio.Future]] = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without awaiting so the next batch is collected (and started) while this one runs
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        logger.debug("Running batch of %d item(s)", len(batch))
+        try:
+            await self._handler([item for item, _ in batch])
+        except asyncio.CancelledError:
+            for _, fut in batch:
+                fut.cancel()
+            raise
+        except Exception as exc:
+            for _, fut in batch:
+                if not fut.done():  # else the caller gave up
+                    fut.set_exception(exc)
+        else:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_result(None)
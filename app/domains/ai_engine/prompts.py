@@ -0,0 +1,62 @@
+# app/domains/ai_engine/prompts.py
+"""
+Prompt text and structured-output schema for dream analysis.
+
+SYSTEM_INSTRUCTION holds everything that is the same for every dream; the user prompt
+(ANALYSIS_PROMPT_TEMPLATE) is only the dream text.
+
+ANALYSIS_RESPONSE_SCHEMA is passed to Vertex as `response_schema` (with
+response_mime_type="application/json"), so the model is constrained to emit exactly
+this JSON object. It covers only the fields the model produces; the pipeline adds
+status/model/generated_at/raw_response and validates the result against DreamAnalysis.
+"""
+
+from typing import Any, Dict
+
+_RISK_LEVEL: Dict[str, Any] = {"type": "string", "enum": ["none", "low", "medium", "high"]}
+
+ANALYSIS_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "emotions": {  # e.g. {"anxiety": 0.8, "joy": 0.2}
+            "type": "object",
+            "additionalProperties": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+        },
+        "sentiment_score": {"type": "number", "minimum": -1.0, "maximum": 1.0},
+        "themes": {"type": "array", "items": {"type": "string"}},
+        "symbols": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "symbol": {"type": "string"},
+                    "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                    "explanation": {"type": "string"},
+                },
+                "required": ["symbol", "confidence", "explanation"],
+            },
+        },
+        "risk_flags": {
+            "type": "object",
+            "properties": {
+                "self_harm": _RISK_LEVEL,
+                "suicide": _RISK_LEVEL,
+                "violence": {"type": "boolean"},
+                "abuse_mention": {"type": "boolean"},
+            },
+            "required": ["self_harm", "suicide", "violence", "abuse_mention"],
+        },
+    },
+    "required": ["summary", "emotions", "sentiment_score", "themes", "symbols", "risk_flags"],
+}
+
+# Invariant instructions, sent once per model as `system_instruction` so Vertex can reuse the
+# cached prefix across requests; the per-request user part carries only the dream text.
+SYSTEM_INSTRUCTION = (
+    "You are an empathetic mental health analysis assistant. Analyze the user's dream text. "
+    "Emotion intensities and symbol confidences are between 0 and 1; "
+    "sentiment_score is between -1.0 and 1.0."
+)
+
+ANALYSIS_PROMPT_TEMPLATE = "Dream text:\n---\n{text}\n---"
@@ -2,35 +2,122 @@
 """
 Modern AI integration using the high-level Vertex AI SDK.
 - Analyzes dream text using a Vertex AI generative model (e.g., Gemini).
-- Returns a structured dict matching the DreamAnalysis schema.
+- Requests structured JSON output (prompts.ANALYSIS_RESPONSE_SCHEMA) and returns it
+  validated as a DreamAnalysis.
+- Repeated dream texts are served from an in-process analysis cache (no Vertex call).
 """
 
 import os
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime, timezone
 
-import vertexai
-from vertexai.generative_models import GenerativeModel, Part, GenerationConfig
+import orjson
+from cachetools import TTLCache
+from pydantic import Field as PydField
 from app.core.config import settings
+from app.domains.ai_engine.prompts import ANALYSIS_PROMPT_TEMPLATE, ANALYSIS_RESPONSE_SCHEMA, SYSTEM_INSTRUCTION
+from app.domains.dreams.models import DreamAnalysis, SymbolAnalysis
+
+if TYPE_CHECKING:  # the SDK itself is imported lazily (see _load_vertex_sdk)
+    from vertexai.generative_models import GenerationConfig, GenerativeModel
 
 logger = logging.getLogger(__name__)
 
-try:
+# --- Lazy SDK import + init ---
+# Importing vertexai pulls in the whole aiplatform client stack (over a second of import time), and
+# vertexai.init does blocking credential discovery (ADC files, possibly the GCE metadata server).
+# Both run once, in a worker thread, on first use instead of at app import.
+_VERTEX_INITIALIZED = False
+_VERTEX_INIT_LOCK = asyncio.Lock()
+
+
+def _load_vertex_sdk() -> None:
+    import vertexai
+    import vertexai.generative_models  # noqa: F401  (loaded here so later imports are cache hits)
+
     if settings.GOOGLE_PROJECT and settings.GOOGLE_REGION:
         vertexai.init(project=settings.GOOGLE_PROJECT, location=settings.GOOGLE_REGION)
-        logger.info(f"Vertex AI SDK initialized for project '{settings.GOOGLE_PROJECT}' in region '{settings.GOOGLE_REGION}'")
+        logger.info("Vertex AI SDK initialized for project '%s' in region '%s'", settings.GOOGLE_PROJECT, settings.GOOGLE_REGION)
     else:
         logger.warning("Vertex AI SDK not initialized because GOOGLE_PROJECT or GOOGLE_REGION is missing.")
-except Exception as e:
-    logger.error(f"Failed to initialize Vertex AI SDK: {e}", exc_info=True)
+
+
+async def _ensure_vertex_init() -> None:
+    global _VERTEX_INITIALIZED
+    if _VERTEX_INITIALIZED:
+        return
+    async with _VERTEX_INIT_LOCK:
+        if _VERTEX_INITIALIZED:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, _load_vertex_sdk)
+        except Exception as e:
+            logger.error("Failed to initialize Vertex AI SDK: %s", e, exc_info=True)
+            raise
+        _VERTEX_INITIALIZED = True
+
+
+# --- Model singleton ---
+# Built once per process on first use; each request then only pays for the RPC.
+_MODEL: Optional["GenerativeModel"] = None
+_GENERATION_CONFIG: Optional["GenerationConfig"] = None
+_MODEL_LOCK = asyncio.Lock()
+
+
+async def _get_model() -> "GenerativeModel":
+    global _MODEL, _GENERATION_CONFIG
+    if _MODEL is None:
+        await _ensure_vertex_init()
+        async with _MODEL_LOCK:
+            if _MODEL is None:
+                from vertexai.generative_models import GenerationConfig, GenerativeModel
+
+                # JSON mode + response_schema: Vertex guarantees a parseable object in the expected shape.
+                _GENERATION_CONFIG = GenerationConfig(
+                    temperature=0.1,
+                    max_output_tokens=2048,
+                    response_mime_type="application/json",
+                    response_schema=ANALYSIS_RESPONSE_SCHEMA,
+                )
+                _MODEL = GenerativeModel(settings.VERTEX_AI_MODEL, system_instruction=SYSTEM_INSTRUCTION)
+    return _MODEL
+
+
+async def warm_up_model() -> None:
+    """
+    Build the shared model ahead of the first analysis so it overlaps other I/O
+    (dream fetch, transcription). Never raises; a failure here resurfaces on the real call.
+    """
+    try:
+        await _get_model()
+    except Exception as e:
+        logger.warning("Vertex AI model warm-up failed: %s", e)
+
+
+# The raw LLM text duplicates the parsed fields; only keep it for debugging/audits.
+INCLUDE_RAW_RESPONSE = settings.DEBUG
+
+
+# --- Analysis cache ---
+# Exact-match cache keyed by SHA-256 of the normalized text (case/whitespace-insensitive).
+# Bounded (LRU-style eviction at maxsize) and time-limited so prompt/model changes roll out within the TTL.
+_ANALYSIS_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60 * 60)
+
+
+def _analysis_cache_key(text: str) -> str:
+    normalized = " ".join(text.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
 
 # --- Core AI Service ---
 
-async def analyze_text_with_vertex(text: str) -> Dict[str, Any]:
+async def analyze_text_with_vertex(text: str) -> DreamAnalysis:
     """
     Calls a Vertex AI generative model using the modern SDK.
+    Returns a DreamAnalysis, stored as-is on DreamModel.analysis.
     """
     # UPDATED: Check for settings at the time of the function call
     if not all([settings.GOOGLE_PROJECT, settings.GOOGLE_REGION, settings.VERTEX_AI_MODEL]):
@@ -38,51 +125,58 @@ async def analyze_text_with_vertex(text: str) -> Dict[str, Any]:
 
     if not text or not text.strip():
         logger.warning("analyze_text_with_vertex called with empty text.")
-        return {"status": "complete", "summary": "No text provided.", "raw_response": ""}
-
-    prompt = f"""
-You are an empathetic mental health analysis assistant. Analyze the user's dream text below.
-Produce a JSON object only (no other text, no markdown fences) that follows this exact schema:
-
-{{
-  "summary": "string",
-  "emotions": {{ "<emotion>": number (0 to 1) }},
-  "sentiment_score": number (-1.0 to 1.0),
-  "themes": ["string"],
-  "symbols": [{{ "symbol": "string", "confidence": number, "explanation": "string" }}],
-  "risk_flags": {{
-     "self_harm": "none|low|medium|high",
-     "suicide": "none|low|medium|high",
-     "violence": boolean,
-     "abuse_mention": boolean
-  }}
-}}
-
-Dream text:
----
-{text}
----
-
-Return only the valid JSON object.
-"""
+        return DreamAnalysis(status="complete", summary="No text provided.")
 
-    try:
-        # Load the generative model using the model name from settings
-        model = GenerativeModel(settings.VERTEX_AI_MODEL)
+    cache_key = _analysis_cache_key(text)
+    cached = _ANALYSIS_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Analysis cache hit; skipping Vertex AI call.")
+        return cached.model_copy(update={"generated_at": datetime.now(timezone.utc)})
+
+    analysis = await _generate_analysis(text)
+    _ANALYSIS_CACHE[cache_key] = analysis
+    return analysis.model_copy()
+
+
+class _SymbolOutput(SymbolAnalysis):
+    confidence: float = PydField(..., ge=0.0, le=1.0)
 
-        generation_config = GenerationConfig(temperature=0.1, max_output_tokens=2048)
 
-        response = await model.generate_content_async([prompt], generation_config=generation_config)
+class _AnalysisOutput(DreamAnalysis):
+    """
+    Validation for fresh model output: the value ranges of ANALYSIS_RESPONSE_SCHEMA are enforced here,
+    not on the stored DreamAnalysis (older documents fall outside them and must still load).
+    """
+    sentiment_score: Optional[float] = PydField(None, ge=-1.0, le=1.0)
+    symbols: Optional[List[_SymbolOutput]] = None
 
-        model_text = response.text.strip().replace("```json", "").replace("```", "").strip()
-        parsed_json = json.loads(model_text)
 
-        parsed_json["status"] = "complete"
-        parsed_json["model"] = settings.VERTEX_AI_MODEL
-        parsed_json["generated_at"] = datetime.now(timezone.utc).isoformat()
-        parsed_json["raw_response"] = model_text
-        return parsed_json
+async def _generate_analysis(text: str) -> DreamAnalysis:
+    """
+    Single Vertex AI call for one dream text (cache misses from analyze_text_with_vertex).
+    """
+    prompt = ANALYSIS_PROMPT_TEMPLATE.format(text=text)
+
+    try:
+        model = await _get_model()
+        response = await model.generate_content_async([prompt], generation_config=_GENERATION_CONFIG)
+
+        # Structured output: the text is the schema-conforming JSON object, no fences to strip.
+        # (response.text raises if the candidate has no parts, e.g. a blocked response.)
+        model_text = response.text
+        parsed_json = orjson.loads(model_text)
+
+        result = {
+            **parsed_json,
+            "status": "complete",
+            "model": settings.VERTEX_AI_MODEL,
+            "generated_at": datetime.now(timezone.utc),
+        }
+        if INCLUDE_RAW_RESPONSE:
+            result["raw_response"] = model_text
+        return _AnalysisOutput.model_validate(result)
 
     except Exception as e:
-        logger.error(f"Error during Vertex AI call: {e}", exc_info=True)
-        raise
\ No newline at end of file
+        logger.error("Error during Vertex AI call: %s", e, exc_info=True)
+        raise
+
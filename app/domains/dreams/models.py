@@ -1,7 +1,56 @@
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, Field as PydField, HttpUrl
-from odmantic import Model, Field as OdmField
+from typing import Annotated, Optional, List, Dict, Any, Union
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field as PydField
+from odmantic import Index, Model, Field as OdmField
+from odmantic.config import ODMConfigDict
+
+# ------------------------------
+# Small structured types used inside analysis
+# ------------------------------
+# Value ranges (confidence 0..1, sentiment -1..1) are enforced on fresh model output in
+# ai_engine/services.py, not here: stored analyses predate them and must keep loading.
+class SymbolAnalysis(BaseModel):
+    symbol: str
+    confidence: float
+    explanation: Optional[str] = None
+
+
+class RiskFlags(BaseModel):
+    """
+    Risk flags inferred from analysis; used for triage and safe routing.
+    Values like 'low'/'medium'/'high' allow graded responses.
+    """
+    self_harm: str = "none"  # enum: none|low|medium|high
+    suicide: str = "none"
+    violence: bool = False
+    abuse_mention: bool = False
+
+
+class DreamAnalysis(BaseModel):
+    """
+    Structured analysis produced by the AI pipeline.
+    - status: lifecycle of the analysis
+    - raw_response: store full model output for audits; restrict access in production.
+    Stored on DreamModel.analysis as a typed subdocument.
+    """
+    status: str = "pending"  # pending | processing | complete | error
+    model: Optional[str] = None
+    generated_at: Optional[datetime] = None
+    summary: Optional[str] = None
+    emotions: Optional[Dict[str, float]] = None          # e.g., {"anxiety": 0.8, "joy": 0.2}
+    sentiment_score: Optional[float] = None
+    themes: Optional[List[str]] = None
+    symbols: Optional[List[SymbolAnalysis]] = None
+    risk_flags: Optional[RiskFlags] = None
+    raw_response: Optional[Any] = None  # original LLM/AI response (audit), may store as dict/string
+    error: Optional[str] = None  # set when status == "error"
+
+
+# Stored analysis: typed when it fits DreamAnalysis, otherwise kept as the raw dict. Older dreams hold
+# free-form LLM JSON (e.g. symbols as plain strings) that must not make the whole document unreadable.
+# left_to_right: a dict input would otherwise always pick the exact-type Dict branch.
+StoredAnalysis = Annotated[Union[DreamAnalysis, Dict[str, Any]], PydField(union_mode="left_to_right")]
+
 
 # ------------------------------
 # Dream Odmantic DB model
@@ -13,17 +62,25 @@ class DreamModel(Model):
     - `analysis` holds the result of the AI pipeline. Start with `analysis` as None then populate when ready.
     """
     user_id: str = OdmField(...)  # store user id (string). Option: use Reference for real relations
-    timestamp: datetime = OdmField(default_factory=datetime.utcnow)
+    timestamp: datetime = OdmField(default_factory=lambda: datetime.now(timezone.utc))
     timezone: Optional[str] = OdmField(default="Asia/Kolkata")
     text_content: Optional[str] = OdmField(default=None, max_length=20000)
     audio_url: Optional[str] = OdmField(default=None)  # signed URL to Cloud Storage
     audio_duration_seconds: Optional[float] = OdmField(default=None)
     audio_transcript: Optional[str] = OdmField(default=None)
     language: Optional[str] = OdmField(default="en")
-    analysis: Optional[Dict[str, Any]] = OdmField(default=None)  # store structured analysis JSON
+    analysis: Optional[StoredAnalysis] = OdmField(default=None)  # structured analysis subdocument
     share_policy: Optional[Dict[str, bool]] = OdmField(default_factory=lambda: {
         "shareable": False, "forum_anonymous": False, "allow_research": False
     })
     status: str = OdmField(default="created")  # created | processing | analyzed | error
-    created_at: datetime = OdmField(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = OdmField(default=None)
\ No newline at end of file
+    created_at: datetime = OdmField(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: Optional[datetime] = OdmField(default=None)
+
+    model_config = ODMConfigDict(
+        # Serves list_dreams_for_user: equality on user_id, newest-first by created_at (no in-memory SORT).
+        # Created at startup by engine.configure_database([DreamModel]).
+        indexes=lambda: [
+            Index(DreamModel.user_id, DreamModel.created_at.desc(), name="user_created_desc"),
+        ],
+    )
@@ -1,57 +1,24 @@
-from pydantic.config import ConfigDict
 """
 app/domains/dreams/schemas.py
 
 Contains:
-- Odmantic Model: DreamModel  (database representation)
-- Pydantic schemas: DreamCreate, DreamAnalysis, DreamDB, etc.
+- Pydantic schemas: DreamCreate, DreamDB
+- Re-exports of the analysis types defined once in models.py (SymbolAnalysis, RiskFlags, DreamAnalysis)
+  and of DreamModel (database representation)
 
 Notes:
  - Audio files should be uploaded to Cloud Storage (GCS/S3). Save signed URLs in `audio_url`.
  - analysis.raw_response can contain the full LLM output; control access carefully.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Any, Optional, Dict, List
 from datetime import datetime
-from pydantic import BaseModel, Field as PydField, HttpUrl
-from odmantic import Model, Field as OdmField
 
-# ------------------------------
-# Small structured types used inside analysis
-# ------------------------------
-class SymbolAnalysis(BaseModel):
-    symbol: str
-    confidence: float = PydField(..., ge=0.0, le=1.0)
-    explanation: Optional[str] = None
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field as PydField
 
+from app.domains.dreams.models import DreamModel, SymbolAnalysis, RiskFlags, DreamAnalysis, StoredAnalysis
 
-class RiskFlags(BaseModel):
-    """
-    Risk flags inferred from analysis; used for triage and safe routing.
-    Values like 'low'/'medium'/'high' allow graded responses.
-    """
-    self_harm: str = "none"  # enum: none|low|medium|high
-    suicide: str = "none"
-    violence: bool = False
-    abuse_mention: bool = False
-
-
-class DreamAnalysis(BaseModel):
-    """
-    Structured analysis produced by the AI pipeline.
-    - status: lifecycle of the analysis
-    - raw_response: store full model output for audits; restrict access in production.
-    """
-    status: str = "pending"  # pending | processing | complete | failed
-    model: Optional[str] = None
-    generated_at: Optional[datetime] = None
-    summary: Optional[str] = None
-    emotions: Optional[Dict[str, float]] = None          # e.g., {"anxiety": 0.8, "joy": 0.2}
-    sentiment_score: Optional[float] = PydField(None, ge=-1.0, le=1.0)
-    themes: Optional[List[str]] = None
-    symbols: Optional[List[SymbolAnalysis]] = None
-    risk_flags: Optional[RiskFlags] = None
-    raw_response: Optional[Any] = None  # original LLM/AI response (audit), may store as dict/string
 
 # ------------------------------
 # Pydantic / API Schemas
@@ -69,16 +36,10 @@ class DreamCreate(BaseModel):
     )
 
 
-class SymbolAnalysisSchema(SymbolAnalysis):
-    pass  # reuse
-
-
-class RiskFlagsSchema(RiskFlags):
-    pass  # reuse
-
-
-class DreamAnalysisSchema(DreamAnalysis):
-    pass  # reuse; this ensures type hints and JSON schema for responses
+# Aliases kept for existing imports; one class (and one CoreSchema) per type
+SymbolAnalysisSchema = SymbolAnalysis
+RiskFlagsSchema = RiskFlags
+DreamAnalysisSchema = DreamAnalysis
 
 
 class DreamDB(BaseModel):
@@ -91,11 +52,11 @@ class DreamDB(BaseModel):
     timestamp: datetime
     timezone: Optional[str] = "Asia/Kolkata"
     text_content: Optional[str] = None
-    audio_url: Optional[HttpUrl] = None
+    audio_url: Optional[str] = None  # local path (dev) or gs:// URI, not necessarily http(s)
     audio_duration_seconds: Optional[float] = None
     audio_transcript: Optional[str] = None
     language: Optional[str] = "en"
-    analysis: Optional[DreamAnalysisSchema] = None
+    analysis: Optional[StoredAnalysis] = None  # DreamAnalysis, or the raw dict of an older free-form analysis
     share_policy: Optional[Dict[str, bool]] = None
     status: str = "created"
     created_at: datetime
@@ -113,9 +74,79 @@ class DreamDB(BaseModel):
 def dreammodel_to_dto(d: DreamModel) -> DreamDB:
     """
     Convert Odmantic DreamModel to DreamDB Pydantic DTO for API response.
-    Handles simple field conversions and ensures proper types.
+    The document was already validated by odmantic on load, so the DTO is built with
+    model_construct (no second validation pass); stored values are passed through unchanged.
+    """
+    return DreamDB.model_construct(
+        id=str(d.id),  # Ensure the id is a string
+        user_id=d.user_id,
+        timestamp=d.timestamp,
+        timezone=d.timezone,
+        text_content=d.text_content,
+        audio_url=d.audio_url,
+        audio_duration_seconds=d.audio_duration_seconds,
+        audio_transcript=d.audio_transcript,
+        language=d.language,
+        analysis=d.analysis,
+        share_policy=d.share_policy,
+        status=d.status,
+        created_at=d.created_at,
+        updated_at=d.updated_at,
+    )
+
+
+class DreamOut(msgspec.Struct):
+    """
+    Encoding shape for GET /dreams (serialize_dreams), which skips pydantic for whole pages.
+    Documented in OpenAPI as List[DreamDB], so a field added to DreamDB must be added here too.
+    """
+    id: str = msgspec.field(name="_id")
+    user_id: str
+    timestamp: datetime
+    timezone: Optional[str]
+    text_content: Optional[str]
+    audio_url: Optional[str]
+    audio_duration_seconds: Optional[float]
+    audio_transcript: Optional[str]
+    language: Optional[str]
+    analysis: Optional[StoredAnalysis]
+    share_policy: Optional[Dict[str, bool]]
+    status: str
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+
+def _enc_hook(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):  # DreamAnalysis subdocument
+        return obj.model_dump()
+    raise NotImplementedError(f"Cannot encode {type(obj)!r}")
+
+
+_DREAM_LIST_ENCODER = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+def serialize_dreams(docs: List[DreamModel]) -> bytes:
+    """
+    JSON-encode dreams for list responses straight from the Odmantic models (no DreamDB per item).
+    Output matches List[DreamDB]. datetimes are encoded by msgspec as given: the Motor client
+    is tz_aware, so they are UTC-aware and emitted with a "Z" suffix.
     """
-    # Using model_dump and then constructing the DTO ensures correct aliasing and type coercion
-    model_data = d.model_dump()
-    model_data["_id"] = str(d.id) # Ensure the id is a string for the alias
-    return DreamDB.model_validate(model_data)
\ No newline at end of file
+    return _DREAM_LIST_ENCODER.encode([
+        DreamOut(
+            id=str(d.id),
+            user_id=d.user_id,
+            timestamp=d.timestamp,
+            timezone=d.timezone,
+            text_content=d.text_content,
+            audio_url=d.audio_url,
+            audio_duration_seconds=d.audio_duration_seconds,
+            audio_transcript=d.audio_transcript,
+            language=d.language,
+            analysis=d.analysis,
+            share_policy=d.share_policy,
+            status=d.status,
+            created_at=d.created_at,
+            updated_at=d.updated_at,
+        )
+        for d in docs
+    ])
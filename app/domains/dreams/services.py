@@ -4,15 +4,15 @@ Uses asyncio and background tasks to avoid blocking the event loop.
 Includes structured logging and follows SonarQube best practices.
 """
 
+import asyncio
 import logging
 from typing import Optional, List
 from datetime import datetime, timezone
 from bson import ObjectId
-from bson.errors import InvalidId
 from odmantic import AIOEngine
 
-from app.db.session import get_engine
-from app.domains.dreams.models import DreamModel
+from app.db.session import dreams_coll, get_engine
+from app.domains.dreams.models import DreamAnalysis, DreamModel
 from app.domains.dreams.schemas import DreamCreate
 from app.domains.ai_engine import services as ai_services
 
@@ -36,6 +36,8 @@ STATUS_CREATED = "created"
 STATUS_PROCESSING = "processing"
 STATUS_ANALYZED = "analyzed"
 STATUS_ERROR = "error"
+# Fields left out of list responses (large, debug-only)
+LIST_PROJECTION = {"analysis.raw_response": 0}
 
 
 # ------------------------------
@@ -70,9 +72,9 @@ async def create_dream(
         updated_at=now
     )
 
-    logger.info(f"Creating dream for user_id={user_id}, dream_id will be assigned after save.")
+    logger.info("Creating dream for user_id=%s, dream_id will be assigned after save.", user_id)
     await engine.save(dream)
-    logger.info(f"Dream created with id={dream.id}")
+    logger.info("Dream created with id=%s", dream.id)
 
     return dream
 
@@ -85,18 +87,20 @@ async def list_dreams_for_user(
     """
     Retrieve a paginated list of dreams for a specific user, sorted by creation date (newest first).
     """
-    engine: AIOEngine = get_engine()
-    logger.info(f"Fetching dreams for user_id={user_id}, skip={skip}, limit={limit}")
-
-    docs = await engine.find(
-        DreamModel,
-        DreamModel.user_id == user_id,
-        sort=DreamModel.created_at.desc(),
+    logger.info("Fetching dreams for user_id=%s, skip=%s, limit=%s", user_id, skip, limit)
+
+    # Raw Motor find so raw_response (if any) never crosses the wire. The returned models are
+    # partial (read-only): saving one would overwrite its stored analysis.
+    cursor = dreams_coll.find(
+        {"user_id": user_id},
+        projection=LIST_PROJECTION,
+        sort=[("created_at", -1)],
         skip=skip,
         limit=limit
     )
+    docs = [DreamModel.model_validate_doc(doc) async for doc in cursor]
 
-    logger.info(f"Found {len(docs)} dreams for user_id={user_id}")
+    logger.info("Found %d dreams for user_id=%s", len(docs), user_id)
     return docs
 
 
@@ -106,19 +110,18 @@ async def get_dream_by_id(dream_id: str) -> Optional[DreamModel]:
     """
     engine: AIOEngine = get_engine()
 
-    try:
-        obj_id = ObjectId(dream_id)
-    except InvalidId:
-        logger.warning(f"Invalid ObjectId format: {dream_id}")
+    if not ObjectId.is_valid(dream_id):
+        logger.warning("Invalid ObjectId format: %s", dream_id)
         return None
+    obj_id = ObjectId(dream_id)
 
-    logger.debug(f"Querying dream with ObjectId={obj_id}")
+    logger.debug("Querying dream with ObjectId=%s", obj_id)
     doc = await engine.find_one(DreamModel, DreamModel.id == obj_id)
 
     if doc:
-        logger.info(f"Dream found: id={doc.id}, user_id={doc.user_id}")
+        logger.info("Dream found: id=%s, user_id=%s", doc.id, doc.user_id)
     else:
-        logger.warning(f"Dream not found for id={dream_id}")
+        logger.warning("Dream not found for id=%s", dream_id)
 
     return doc
 
@@ -130,33 +133,93 @@ async def get_dream_by_id(dream_id: str) -> Optional[DreamModel]:
 async def analyze_dream_background(dream_id: str) -> None:
     """
     Background task to analyze a dream's content (text or audio) using AI services.
-    Updates the dream's `analysis` and `status` fields in the database.
+    Updates the dream's `analysis` and `status` fields in the database with a single save.
     Safe to run asynchronously — handles all errors internally.
     """
-    logger.info(f"Starting background analysis for dream_id={dream_id}")
+    logger.info("Starting background analysis for dream_id=%s", dream_id)
 
     engine: AIOEngine = get_engine()
 
-    # Validate and convert dream_id
-    try:
-        obj_id = ObjectId(dream_id)
-    except InvalidId:
-        logger.error(f"Invalid ObjectId format in background task: {dream_id}")
+    # Validate and convert dream_id (is_valid: no exception raised/unwound for bad ids)
+    if not ObjectId.is_valid(dream_id):
+        logger.error("Invalid ObjectId format in background task: %s", dream_id)
         return
+    obj_id = ObjectId(dream_id)
+
+    # Build the Vertex model while the dream is fetched (and transcribed), not after
+    warm_up = asyncio.create_task(ai_services.warm_up_model())
+    try:
+        # Fetch dream
+        dream = await engine.find_one(DreamModel, DreamModel.id == obj_id)
+        if not dream:
+            logger.warning("Dream not found for id=%s during background analysis", dream_id)
+            return
+
+        await _analyze_dream(dream)
+        await engine.save(dream)
+    finally:
+        await warm_up
+
 
-    # Fetch dream
-    dream = await engine.find_one(DreamModel, DreamModel.id == obj_id)
-    if not dream:
-        logger.warning(f"Dream not found for id={dream_id} during background analysis")
+async def analyze_dreams_batch(dream_ids: List[str]) -> None:
+    """
+    Analyze several dreams at once: one find for all ids, then concurrent analysis where each
+    dream is saved as soon as its own analysis finishes (a slow one never holds back the rest).
+    Save errors are logged per dream; the first one is re-raised once every dream has finished.
+    """
+    engine: AIOEngine = get_engine()
+
+    obj_ids = []
+    for dream_id in dream_ids:
+        if ObjectId.is_valid(dream_id):
+            obj_ids.append(ObjectId(dream_id))
+        else:
+            logger.error("Invalid ObjectId format in batch analysis: %s", dream_id)
+    if not obj_ids:
         return
 
-    logger.info(f"Processing dream id={dream.id} for user_id={dream.user_id}")
+    warm_up = asyncio.create_task(ai_services.warm_up_model())
+    try:
+        dreams = await engine.find(DreamModel, DreamModel.id.in_(obj_ids))
+        if len(dreams) < len(obj_ids):
+            logger.warning("Batch analysis: %d of %d dreams not found", len(obj_ids) - len(dreams), len(obj_ids))
+        if not dreams:
+            return
 
-    # Update status to processing
-    dream.status = STATUS_PROCESSING
-    dream.updated_at = datetime.now(timezone.utc)  # ✅ SonarQube fix
+        results = await asyncio.gather(*(_analyze_and_save(engine, dream) for dream in dreams), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, Exception)]
+        for dream, result in zip(dreams, results):
+            if isinstance(result, Exception):
+                logger.error("Could not save analysis for dream %s: %s", dream.id, result)
+        logger.info("Batch analysis saved %d of %d dreams", len(dreams) - len(errors), len(dreams))
+        if errors:
+            raise errors[0]
+    finally:
+        await warm_up
+
+
+# ------------------------------
+# Helper Functions
+# ------------------------------
+
+async def _analyze_and_save(engine: AIOEngine, dream: DreamModel) -> None:
+    """Analyze one dream and persist it right away (save writes only the modified fields)."""
+    await _analyze_dream(dream)
     await engine.save(dream)
-    logger.debug(f"Dream {dream.id} status updated to '{STATUS_PROCESSING}'")
+
+
+async def _analyze_dream(dream: DreamModel) -> None:
+    """
+    Run transcription (if needed) and analysis for a loaded dream, updating it in memory only.
+    The caller persists the result; errors are recorded on the dream, never raised.
+    """
+    logger.info("Processing dream id=%s for user_id=%s", dream.id, dream.user_id)
+
+    # One timestamp for this pass; refreshed only after the long awaits (STT, Vertex)
+    now = datetime.now(timezone.utc)
+
+    # Not persisted on its own: the caller's single save records the final state
+    dream.status = STATUS_PROCESSING
 
     text_to_analyze = dream.text_content or ""
 
@@ -164,62 +227,55 @@ async def analyze_dream_background(dream_id: str) -> None:
     if not text_to_analyze and dream.audio_url:
         if dream.audio_url.startswith("gs://"):
             try:
-                logger.info(f"Transcribing audio from GCS: {dream.audio_url}")
+                logger.info("Transcribing audio from GCS: %s", dream.audio_url)
                 transcript = await ai_services.transcribe_gcs_audio(dream.audio_url)
                 dream.audio_transcript = transcript
                 text_to_analyze = transcript
-                logger.info(f"Transcription completed for dream {dream.id}, length={len(transcript)} chars")
+                now = datetime.now(timezone.utc)
+                logger.info("Transcription completed for dream %s, length=%d chars", dream.id, len(transcript))
             except Exception as e:
                 error_msg = f"transcription error: {str(e)}"
-                logger.exception(f"Failed to transcribe audio for dream {dream.id}: {error_msg}")
-                await _mark_dream_as_failed(engine, dream, error_msg)
+                logger.exception("Failed to transcribe audio for dream %s: %s", dream.id, error_msg)
+                _mark_dream_as_failed(dream, error_msg, datetime.now(timezone.utc))
                 return
         else:
             error_msg = "audio_url not a gs:// URI; STT requires GCS or local audio upload."
-            logger.warning(f"Cannot transcribe non-GCS audio for dream {dream.id}: {dream.audio_url}")
-            await _mark_dream_as_failed(engine, dream, error_msg)
+            logger.warning("Cannot transcribe non-GCS audio for dream %s: %s", dream.id, dream.audio_url)
+            _mark_dream_as_failed(dream, error_msg, now)
             return
 
     # Skip if still no text
     if not text_to_analyze.strip():
         error_msg = "No text content available for analysis after transcription attempt."
-        logger.warning(f"Dream {dream.id} has no analyzable text")
-        await _mark_dream_as_failed(engine, dream, error_msg)
+        logger.warning("Dream %s has no analyzable text", dream.id)
+        _mark_dream_as_failed(dream, error_msg, now)
         return
 
     # Analyze text with Vertex AI
     try:
-        logger.info(f"Analyzing text for dream {dream.id} with Vertex AI...")
+        logger.info("Analyzing text for dream %s with Vertex AI...", dream.id)
         analysis = await ai_services.analyze_text_with_vertex(text_to_analyze)
         dream.analysis = analysis
         dream.status = STATUS_ANALYZED
         dream.updated_at = datetime.now(timezone.utc)  # ✅ SonarQube fix
-        await engine.save(dream)
-        logger.info(f"Dream {dream.id} successfully analyzed and updated")
+        logger.info("Dream %s successfully analyzed", dream.id)
     except Exception as exc:
         error_msg = f"analysis error: {str(exc)}"
-        logger.exception(f"Failed to analyze dream {dream.id}: {error_msg}")
-        await _mark_dream_as_failed(engine, dream, error_msg)
+        logger.exception("Failed to analyze dream %s: %s", dream.id, error_msg)
+        _mark_dream_as_failed(dream, error_msg, datetime.now(timezone.utc))
 
 
-# ------------------------------
-# Helper Functions
-# ------------------------------
-
-async def _mark_dream_as_failed(
-    engine: AIOEngine,
+def _mark_dream_as_failed(
     dream: DreamModel,
-    error_message: str
+    error_message: str,
+    now: datetime
 ) -> None:
     """
-    Helper to update dream status to 'error' with error message in analysis field.
-    Avoids code duplication.
+    Helper to set dream status to 'error' with error message in analysis field.
+    Avoids code duplication. Does not save; the caller persists the dream.
+    `now` is the caller's current timestamp, used for updated_at.
     """
-    dream.analysis = {
-        "status": STATUS_ERROR,
-        "error": error_message
-    }
+    dream.analysis = DreamAnalysis(status=STATUS_ERROR, error=error_message)
     dream.status = STATUS_ERROR
-    dream.updated_at = datetime.now(timezone.utc)  # ✅ SonarQube fix
-    await engine.save(dream)
-    logger.error(f"Dream {dream.id} marked as failed: {error_message}")
\ No newline at end of file
+    dream.updated_at = now
+    logger.error("Dream %s marked as failed: %s", dream.id, error_message)
@@ -0,0 +1,59 @@
+# app/domains/dreams/tasks.py
+"""
+Scheduling of dream analysis jobs.
+
+With settings.REDIS_URL set, analyses are enqueued on a persistent arq queue (Redis) and run by
+the worker in app/worker.py: jobs survive API restarts, and worker processes scale independently
+of the API. Without it (local dev), they fall back to FastAPI BackgroundTasks in the API process.
+arq is only imported when a queue is configured.
+"""
+
+import asyncio
+import logging
+from typing import Any, Optional
+
+from fastapi import BackgroundTasks
+
+from app.core.config import settings
+from app.domains.dreams.services import analyze_dream_background
+
+logger = logging.getLogger(__name__)
+
+# Name of the arq job function (registered in app/worker.py)
+ANALYZE_DREAM_JOB = "analyze_dream"
+
+_arq_pool: Optional[Any] = None  # arq.connections.ArqRedis
+_arq_pool_lock = asyncio.Lock()
+
+
+async def _get_arq_pool() -> Any:
+    global _arq_pool
+    if _arq_pool is None:
+        async with _arq_pool_lock:
+            if _arq_pool is None:
+                from arq import create_pool
+                from arq.connections import RedisSettings
+
+                _arq_pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    return _arq_pool
+
+
+async def enqueue_dream_analysis(dream_id: str, background_tasks: BackgroundTasks) -> None:
+    """
+    Schedule analysis of `dream_id`: on the arq queue when REDIS_URL is configured,
+    otherwise as an in-process background task.
+    """
+    if not settings.REDIS_URL:
+        background_tasks.add_task(analyze_dream_background, dream_id)
+        return
+    pool = await _get_arq_pool()
+    await pool.enqueue_job(ANALYZE_DREAM_JOB, dream_id)
+    logger.info("Enqueued analysis job for dream_id=%s", dream_id)
+
+
+async def close_arq_pool() -> None:
+    """Close the Redis connection pool (if one was opened); called on application shutdown."""
+    global _arq_pool
+    if _arq_pool is not None:
+        await _arq_pool.close()
+        _arq_pool = None
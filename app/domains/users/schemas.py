@@ -12,19 +12,24 @@ Notes:
 """
 
 from typing import Optional, List, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field as PydField
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field as PydField
+from pydantic.dataclasses import dataclass
+from typing_extensions import TypedDict  # pydantic needs typing_extensions' TypedDict before 3.12
 from odmantic import Model, Field as OdmField
 
 # ------------------------------
 # Helper / small structured types
 # ------------------------------
+# Validated pydantic dataclasses with __slots__: no per-instance __dict__, faster attribute access.
 
 
-class Preferences(BaseModel):
+@dataclass(slots=True, config=ConfigDict(from_attributes=True, revalidate_instances="never"))
+class Preferences:
     """
     User notification / privacy preferences.
-    Kept as a small typed Pydantic model for convenient validation in endpoints.
+    Validates client input (UserUpdate); stored as StoredPreferences and returned as a plain dict.
     """
     timezone: Optional[str] = PydField(default="Asia/Kolkata")
     language: Optional[str] = PydField(default="en")
@@ -36,14 +41,29 @@ class Preferences(BaseModel):
     )
 
 
-class Consent(BaseModel):
+class StoredPreferences(TypedDict, total=False):
+    """
+    The preferences subdocument as stored: known keys are type-checked on load, and the value
+    stays a plain dict, so keys this schema doesn't know survive the next save.
+    """
+    __pydantic_config__ = ConfigDict(extra="allow")
+
+    timezone: Optional[str]
+    language: Optional[str]
+    notifications: Optional[Dict[str, bool]]
+    privacy: Optional[Dict[str, bool]]
+
+
+@dataclass(slots=True)
+class Consent:
     """Model to capture user consent options and timestamp."""
     terms: bool
     data_sharing: bool = False
     date_accepted: Optional[datetime] = None
 
 
-class ModerationInfo(BaseModel):
+@dataclass(slots=True)
+class ModerationInfo:
     """Simple moderation metadata stored for the user (flags, last flagged time)."""
     flags: int = 0
     last_flagged_at: Optional[datetime] = None
@@ -72,13 +92,15 @@ class UserModel(Model):
     pseudonym: Optional[str] = OdmField(default=None)
     is_mentor: bool = OdmField(default=False)
     roles: List[str] = OdmField(default_factory=list)
-    preferences: Optional[Dict[str, Any]] = OdmField(default=None)
+    # Typed subdocuments, validated on load (StoredPreferences stays a dict; Consent/ModerationInfo are decoded).
+    # (Plain pydantic types, like DreamModel.analysis: odmantic 1.x cannot parse Optional[EmbeddedModel].)
+    preferences: Optional[StoredPreferences] = OdmField(default=None)
     onboarding: Optional[Dict[str, Any]] = OdmField(default=None)
     embeddings: Optional[List[float]] = OdmField(default=None)  # vector embeddings for matching (optional)
-    consent: Optional[Dict[str, Any]] = OdmField(default=None)
+    consent: Optional[Consent] = OdmField(default=None)
     status: str = OdmField(default="active")  # 'active' | 'suspended' | 'deleted'
-    moderation: Optional[Dict[str, Any]] = OdmField(default=None)
-    created_at: datetime = OdmField(default_factory=datetime.utcnow)
+    moderation: Optional[ModerationInfo] = OdmField(default=None)
+    created_at: datetime = OdmField(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: Optional[datetime] = OdmField(default=None)
     last_login: Optional[datetime] = OdmField(default=None)
 
@@ -96,7 +118,7 @@ class UserCreate(BaseModel):
     - password is plain-text at this boundary; remember to hash before DB insertion.
     """
     email: EmailStr
-    password: str  # plain on input -> hash before saving
+    password: str = PydField(..., min_length=8, max_length=128)  # plain on input -> hash before saving; bounded hash cost
     name: Optional[str] = None
     timezone: Optional[str] = "Asia/Kolkata"
     language: Optional[str] = "en"
@@ -118,9 +140,11 @@ class UserUpdate(BaseModel):
 class UserLogin(BaseModel):
     """
     Request body for login endpoint.
+    Only an upper bound here (oversized inputs are rejected before any hashing); no minimum so
+    accounts created before the signup rule still log in.
     """
     email: EmailStr
-    password: str
+    password: str = PydField(..., max_length=128)
 
 
 class UserDB(BaseModel):
@@ -129,14 +153,14 @@ class UserDB(BaseModel):
     Contains password_hash (sensible only in server-side contexts).
     """
     id: str = PydField(..., alias="_id")
-    email: EmailStr
+    email: str  # validated at signup (UserCreate); not re-checked on output
     password_hash: str
     name: Optional[str]
     display_name: Optional[str]
     pseudonym: Optional[str]
     is_mentor: bool
     roles: List[str]
-    preferences: Optional[Preferences]
+    preferences: Optional[Dict[str, Any]]  # stored dict, not re-validated as Preferences
     consent: Optional[Consent]
     status: str
     moderation: Optional[ModerationInfo]
@@ -144,9 +168,11 @@ class UserDB(BaseModel):
     updated_at: Optional[datetime]
     last_login: Optional[datetime]
 
-    class Config:
-        allow_population_by_field_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        revalidate_instances="never",
+    )
 
 
 class UserPublic(BaseModel):
@@ -155,17 +181,23 @@ class UserPublic(BaseModel):
     Never include password_hash here.
     """
     id: str = PydField(..., alias="_id")
-    email: EmailStr
+    email: str  # validated at signup (UserCreate); not re-checked on output
     display_name: Optional[str] = None
     pseudonym: Optional[str] = None
     is_mentor: bool = False
-    preferences: Optional[Preferences] = None
+    preferences: Optional[Dict[str, Any]] = None  # stored dict, not re-validated as Preferences
     created_at: datetime
 
-    class Config:
-        allow_population_by_field_name = True
-        orm_mode = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        revalidate_instances="never",
+    )
+
+
+# Resolve the schema once at import (not on first request) and pin the compiled serializer
+UserPublic.model_rebuild()
+_UPUB_SERIALIZER = UserPublic.__pydantic_serializer__
 
 
 # ------------------------------
@@ -176,15 +208,23 @@ def usermodel_to_public(user: UserModel) -> UserPublic:
     Convert an Odmantic UserModel instance to a UserPublic DTO.
     Useful in endpoints to hide sensitive fields before returning to client.
     """
+    # Data comes from the DB (already validated by odmantic): model_construct skips re-validation.
     # Note: Odmantic's Model has an 'id' attribute which is an ObjectId; convert to str
-    return UserPublic(
-        **{
-            "_id": str(user.id),
-            "email": user.email,
-            "display_name": user.display_name,
-            "pseudonym": user.pseudonym,
-            "is_mentor": user.is_mentor,
-            "preferences": user.preferences,
-            "created_at": user.created_at,
-        }
+    return UserPublic.model_construct(
+        id=str(user.id),
+        email=user.email,
+        display_name=user.display_name,
+        pseudonym=user.pseudonym,
+        is_mentor=user.is_mentor,
+        preferences=user.preferences,
+        created_at=user.created_at,
     )
+
+
+def usermodel_to_public_dict(user: UserModel) -> Dict[str, Any]:
+    """
+    UserPublic as a plain dict (by alias, so `_id`), dumped through the pinned serializer.
+    datetimes stay datetime objects for the orjson response class to encode.
+    The one encoding path for UserPublic responses (signup and /me).
+    """
+    return _UPUB_SERIALIZER.to_python(usermodel_to_public(user), by_alias=True)
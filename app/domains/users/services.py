@@ -0,0 +1,52 @@
+"""
+User business logic.
+
+Lookups here read through the raw Motor collection with a projection, so large fields
+(embeddings, moderation) are not transferred unless a caller asks for them.
+Users loaded this way are partial: never engine.save() them (save() rewrites every field).
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+
+from app.db.session import users_coll
+from app.domains.users.schemas import UserModel
+
+
+# ------------------------------
+# Logging Setup
+# ------------------------------
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------
+# Constants
+# ------------------------------
+# Default fields left out of user lookups (embeddings: 768 floats ~ 6 KB of BSON)
+USER_LIGHT_PROJECTION: Dict[str, Any] = {"embeddings": 0, "moderation": 0}
+
+
+# ------------------------------
+# Core Services
+# ------------------------------
+
+async def get_user_light(
+    user_id: str,
+    projection: Dict[str, Any] = USER_LIGHT_PROJECTION
+) -> Optional[UserModel]:
+    """
+    Retrieve a user by id without the heavy fields in `projection`.
+    Returns None if the id is invalid or the user does not exist.
+    Full-document loads (engine.find_one) are for paths that need embeddings or will save.
+    """
+    if not ObjectId.is_valid(user_id):
+        logger.warning("Invalid ObjectId format for user lookup: %s", user_id)
+        return None
+    obj_id = ObjectId(user_id)
+
+    doc = await users_coll.find_one({"_id": obj_id}, projection=projection)
+    if doc is None:
+        return None
+    return UserModel.model_validate_doc(doc)
@@ -1,5 +1,5 @@
 # helpers/serialize.py  -- convert odmantic models to API-safe dicts
-from datetime import datetime
+# datetimes are left as datetime objects: the orjson default response (app/core/responses.py) encodes them.
 from typing import Any, Dict
 
 def oid_to_str(obj_id):
@@ -15,17 +15,17 @@ def usermodel_to_public_dict(user):
         "pseudonym": user.pseudonym,
         "is_mentor": user.is_mentor,
         "preferences": user.preferences,
-        "created_at": user.created_at.isoformat() if isinstance(user.created_at, datetime) else user.created_at
+        "created_at": user.created_at
     }
 
 def dreammodel_to_dict(d):
     return {
         "_id": oid_to_str(d.id),
         "user_id": d.user_id,
-        "timestamp": d.timestamp.isoformat() if d.timestamp else None,
+        "timestamp": d.timestamp,
         "text_content": d.text_content,
         "audio_url": d.audio_url,
         "analysis": d.analysis,
         "status": d.status,
-        "created_at": d.created_at.isoformat() if d.created_at else None
+        "created_at": d.created_at
     }
@@ -4,15 +4,25 @@ Wires up GCP credentials from an environment secret (if provided) and creates DB
 """
 
 import os
+import asyncio
+import atexit
 import base64
+import binascii
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pymongo.errors import OperationFailure
 
 from app.core.config import settings
-from app.db.session import engine
+from app.core.responses import ORJSONUTCResponse
+from app.core.security import shutdown_executor
+from app.db.session import engine, users_coll
+from app.domains.dreams.models import DreamModel
+from app.domains.dreams.tasks import close_arq_pool
 from app.api.v1.endpoints import auth as auth_router_module
 from app.api.v1.endpoints import dreams as dreams_router
 
@@ -22,17 +32,21 @@ LOGS_DIR.mkdir(exist_ok=True)
 LOG_FILE = LOGS_DIR / "app.log"
 for handler in logging.root.handlers[:]:
     logging.root.removeHandler(handler)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
+# Request-path log calls only enqueue the record; a QueueListener thread owns the file/stream
+# handlers, so disk and stderr writes never block the event loop.
+_log_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_log_handlers = [logging.FileHandler(LOG_FILE), logging.StreamHandler()]
+for handler in _log_handlers:
+    handler.setFormatter(_log_formatter)
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # drain queued records at interpreter exit
+logging.root.addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.root.setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title=settings.APP_NAME)
+app = FastAPI(title=settings.APP_NAME, default_response_class=ORJSONUTCResponse)
 
 # CORS Middleware
 app.add_middleware(
@@ -50,50 +64,70 @@ app.include_router(dreams_router.router)
 
 @app.on_event("startup")
 async def startup_event():
-    logger.info(f"VERIFYING SETTINGS: The configured Google region is '{settings.GOOGLE_REGION}'")
+    logger.info("VERIFYING SETTINGS: The configured Google region is '%s'", settings.GOOGLE_REGION)
     logger.info("Application startup...")
 
+    # Widen the anyio thread pool so threadpool-bound work doesn't queue behind the default 40 tokens
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
+
     # UPDATED: Read the service account key from the settings object
     sa_b64 = settings.GCP_SA_KEY_B64
     if sa_b64:
         try:
+            # Strict decode: raw JSON (not base64) fails validation and is written as-is.
+            # Whitespace is dropped first so line-wrapped base64 (e.g. `base64` output, 76 cols) decodes.
             try:
-                sa_bytes = base64.b64decode(sa_b64)
-                if not sa_bytes.strip().startswith(b"{"):
-                    sa_bytes = sa_b64.encode("utf-8")
-            except Exception:
+                sa_bytes = base64.b64decode("".join(sa_b64.split()), validate=True)
+            except binascii.Error:
                 sa_bytes = sa_b64.encode("utf-8")
 
             key_path = "/tmp/gcp_sa_key.json"
-            Path(key_path).write_bytes(sa_bytes)
+            # Owner-only permissions from creation (fchmod covers a file left by a previous run)
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.fchmod(fd, 0o600)
+                os.write(fd, sa_bytes)
+            finally:
+                os.close(fd)
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = key_path
             logger.info("Wrote GCP service account key to /tmp/gcp_sa_key.json")
         except Exception as e:
             logger.error("Error writing GCP SA key: %s", e, exc_info=True)
 
-    # Create DB Indexes
+    # Verify MongoDB connectivity inside uvicorn's own event loop
     try:
-        db_name = settings.MONGO_DB
-        users_coll = engine.client[db_name]["users"]
-        await users_coll.create_index("email", unique=True)
-        
-        dreams_coll_name = "dreammodel"
-        dreams_coll = engine.client[db_name][dreams_coll_name]
-        await dreams_coll.create_index([("user_id", 1), ("timestamp", -1)])
-        logger.info("Database indexes ensured successfully.")
-    except OperationFailure as e:
-        logger.error("Index creation failed due to a database operation error: %s", e)
+        await engine.client.admin.command("ping")
+        logger.info("MongoDB connection is successful.")
     except Exception as e:
-        logger.warning("A non-critical error occurred during index creation: %s", e)
+        logger.error("MongoDB ping failed: %s", e)
+
+    # Create DB Indexes (independent, so issued concurrently: startup waits for the slowest, not the sum)
+    results = await asyncio.gather(
+        # Unique email doubles as signup's duplicate check (DuplicateKeyError -> 409), no pre-insert lookup
+        users_coll.create_index("email", unique=True),
+        # Indexes declared on the models themselves (DreamModel.model_config["indexes"])
+        engine.configure_database([DreamModel]),
+        return_exceptions=True,
+    )
+    errors = [r for r in results if isinstance(r, Exception)]
+    for e in errors:
+        if isinstance(e, OperationFailure):
+            logger.error("Index creation failed due to a database operation error: %s", e)
+        else:
+            logger.warning("A non-critical error occurred during index creation: %s", e)
+    if not errors:
+        logger.info("Database indexes ensured successfully.")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Application shutdown...")
+    await close_arq_pool()
     try:
         engine.client.close()
     except Exception as e:
         logger.warning("Error during motor client shutdown: %s", e)
+    shutdown_executor()
 
 
 @app.get("/")
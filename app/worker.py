@@ -0,0 +1,52 @@
+# app/worker.py
+"""
+arq worker for dream analysis jobs (enqueued by app/domains/dreams/tasks.py).
+
+Run with:  arq app.worker.WorkerSettings   (requires REDIS_URL)
+
+Up to `max_jobs` analyze_dream jobs run at once. Their dream ids are collected for up to
+ANALYSIS_BATCH_WAIT seconds (at most ANALYSIS_BATCH_MAX ids) by a MicroBatcher and handed to
+analyze_dreams_batch together: one Mongo find for the batch, then concurrent analyses, each
+dream saved as soon as its own analysis finishes. Each batch runs in its own task, so the next
+one is collected and started while earlier ones are still transcribing/analyzing.
+"""
+
+import logging
+from typing import Any, Dict
+
+from arq.connections import RedisSettings
+
+from app.core.config import settings
+from app.db.session import engine
+from app.domains.ai_engine.batcher import MicroBatcher
+from app.domains.dreams.services import analyze_dreams_batch
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_BATCH_MAX = 8
+ANALYSIS_BATCH_WAIT = 0.1  # seconds
+
+
+async def analyze_dream(ctx: Dict[str, Any], dream_id: str) -> None:
+    """arq job: analyze one dream (batched with concurrently running jobs)."""
+    await ctx["dream_batches"].submit(dream_id)
+
+
+async def startup(ctx: Dict[str, Any]) -> None:
+    ctx["dream_batches"] = MicroBatcher[str](
+        analyze_dreams_batch, max_batch=ANALYSIS_BATCH_MAX, max_wait=ANALYSIS_BATCH_WAIT
+    )
+    ctx["dream_batches"].start()
+
+
+async def shutdown(ctx: Dict[str, Any]) -> None:
+    await ctx["dream_batches"].stop()
+    engine.client.close()
+
+
+class WorkerSettings:
+    functions = [analyze_dream]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL) if settings.REDIS_URL else RedisSettings()
+    max_jobs = ANALYSIS_BATCH_MAX * 2  # jobs in flight per worker; batches of up to ANALYSIS_BATCH_MAX run concurrently
@@ -0,0 +1,68 @@
+"""Signup and /me endpoints: success, duplicate-email handling and the public user shape."""
+
+import pymongo.errors
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from odmantic.exceptions import DuplicateKeyError
+
+from app.api.v1.endpoints import auth
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """auth router with engine.save backed by an in-memory unique-email "collection"; /me returns the last signup."""
+    emails = set()
+    saved = []
+
+    async def fake_save(instance):
+        if instance.email in emails:
+            # What odmantic raises when the unique email index rejects the insert
+            raise DuplicateKeyError(instance, pymongo.errors.DuplicateKeyError("E11000 duplicate key error"))
+        emails.add(instance.email)
+        saved.append(instance)
+        return instance
+
+    async def fake_hash(password):
+        return "hashed:" + password
+
+    monkeypatch.setattr(auth.engine, "save", fake_save)
+    monkeypatch.setattr(auth, "get_password_hash", fake_hash)
+
+    app = FastAPI()
+    app.include_router(auth.router)
+    app.dependency_overrides[auth.get_current_user] = lambda: saved[-1]
+    return TestClient(app)
+
+
+SIGNUP = {"email": "dreamer@example.com", "password": "correct-horse", "name": "Dreamer"}
+
+
+def test_signup_returns_public_user(client):
+    response = client.post("/api/v1/auth/signup", json=SIGNUP)
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["email"] == SIGNUP["email"]
+    assert body["_id"]
+    assert "password_hash" not in body
+
+
+def test_signup_duplicate_email_returns_409(client):
+    assert client.post("/api/v1/auth/signup", json=SIGNUP).status_code == 201
+
+    response = client.post("/api/v1/auth/signup", json=SIGNUP)
+
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Email already registered"
+
+
+def test_me_returns_same_public_user_as_signup(client):
+    signup = client.post("/api/v1/auth/signup", json=SIGNUP).json()
+
+    response = client.get("/api/v1/auth/me")
+
+    assert response.status_code == 200
+    assert response.json() == signup
+    assert signup["preferences"] == {"timezone": "Asia/Kolkata", "language": "en"}
+    assert signup["created_at"].endswith("Z")
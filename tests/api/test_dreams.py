@@ -0,0 +1,57 @@
+"""Dream endpoints: create (with and without audio) and read back by id."""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import dreams
+from app.db.session import engine
+
+USER_ID = "user-1"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """dreams router with engine.save / engine.find_one backed by an in-memory "collection"."""
+    stored = {}
+
+    async def fake_save(instance):
+        stored[instance.id] = instance
+        return instance
+
+    async def fake_find_one(model, query):
+        return stored.get(dict(query)["_id"]["$eq"])
+
+    monkeypatch.setattr(engine, "save", fake_save)
+    monkeypatch.setattr(engine, "find_one", fake_find_one)
+
+    app = FastAPI()
+    app.include_router(dreams.router)
+    return TestClient(app, headers={"X-User-Id": USER_ID})
+
+
+def test_create_dream_with_audio(client):
+    response = client.post(
+        "/api/v1/dreams/",
+        data={"payload": json.dumps({"text_content": "I was flying"})},
+        files={"audio": ("dream.m4a", b"\x00\x01fake-audio", "audio/mp4")},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    # Local upload path (dev); in production a gs:// URI. Neither is an http(s) URL.
+    assert body["audio_url"].endswith("_dream.m4a")
+    assert body["user_id"] == USER_ID
+
+    fetched = client.get(f"/api/v1/dreams/{body['_id']}")
+    assert fetched.status_code == 200
+    assert fetched.json()["audio_url"] == body["audio_url"]
+
+
+def test_create_dream_without_audio(client):
+    response = client.post("/api/v1/dreams/", data={"payload": json.dumps({"text_content": "A quiet lake"})})
+
+    assert response.status_code == 200
+    assert response.json()["audio_url"] is None
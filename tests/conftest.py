@@ -0,0 +1,14 @@
+"""
+Test settings: app.core.config reads required values from the environment at import time,
+so defaults are set here before any app module is imported. No MongoDB server is needed:
+the Motor client connects lazily and the tests replace the calls that would reach it.
+"""
+
+import os
+import tempfile
+
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("MONGO_DB", "better_yuu_test")
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("MONGO_COMPRESSORS", "zlib")  # zstd needs an extra package
+os.environ.setdefault("UPLOAD_FOLDER", tempfile.mkdtemp(prefix="better-yuu-uploads-"))
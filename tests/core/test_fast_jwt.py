@@ -0,0 +1,168 @@
+"""HS256 fast path (app/core/fast_jwt.py): PyJWT interop and rejection of bad tokens."""
+
+import base64
+import time
+
+import jwt
+import orjson
+import pytest
+
+from app.core import fast_jwt
+
+SECRET = "test-secret"
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _forge(header: dict, payload: dict, signature: str = "") -> str:
+    """Token with arbitrary header/payload segments and the given (possibly empty) signature."""
+    return f"{_b64(orjson.dumps(header))}.{_b64(orjson.dumps(payload))}.{signature}"
+
+
+def _future() -> int:
+    return int(time.time()) + 600
+
+
+# -------------------------
+# Interop with PyJWT
+# -------------------------
+def test_pyjwt_decodes_fast_jwt_token():
+    payload = {"sub": "user-1", "exp": _future()}
+    token = fast_jwt.encode(payload, SECRET)
+
+    assert jwt.decode(token, SECRET, algorithms=["HS256"]) == payload
+
+
+def test_fast_jwt_decodes_pyjwt_token():
+    payload = {"sub": "user-1", "exp": _future(), "nbf": int(time.time()) - 10}
+    token = jwt.encode(payload, SECRET, algorithm="HS256")
+
+    assert fast_jwt.decode(token, SECRET) == payload
+
+
+def test_round_trip():
+    payload = {"sub": "user-1", "exp": _future()}
+
+    assert fast_jwt.decode(fast_jwt.encode(payload, SECRET), SECRET) == payload
+
+
+# -------------------------
+# Signature
+# -------------------------
+def test_tampered_signature_is_rejected():
+    token = fast_jwt.encode({"sub": "user-1", "exp": _future()}, SECRET)
+    head, _, signature = token.rpartition(".")
+    tampered = head + "." + ("A" if signature[0] != "A" else "B") + signature[1:]
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        fast_jwt.decode(tampered, SECRET)
+
+
+def test_tampered_payload_is_rejected():
+    token = fast_jwt.encode({"sub": "user-1", "exp": _future()}, SECRET)
+    header_segment, _, signature = token.split(".")
+    forged_payload = _b64(orjson.dumps({"sub": "admin", "exp": _future()}))
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        fast_jwt.decode(f"{header_segment}.{forged_payload}.{signature}", SECRET)
+
+
+def test_wrong_secret_is_rejected():
+    token = fast_jwt.encode({"sub": "user-1", "exp": _future()}, SECRET)
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        fast_jwt.decode(token, "other-secret")
+
+
+# -------------------------
+# Algorithm header
+# -------------------------
+def test_alg_none_is_rejected():
+    token = _forge({"alg": "none", "typ": "JWT"}, {"sub": "user-1", "exp": _future()})
+
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        fast_jwt.decode(token, SECRET)
+
+
+@pytest.mark.parametrize("alg", ["HS384", "HS512"])
+def test_other_hmac_algorithms_are_rejected(alg):
+    token = jwt.encode({"sub": "user-1", "exp": _future()}, SECRET, algorithm=alg)
+
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        fast_jwt.decode(token, SECRET)
+
+
+def test_rs256_header_is_rejected():
+    token = _forge({"alg": "RS256", "typ": "JWT"}, {"sub": "user-1", "exp": _future()}, signature="c2ln")
+
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        fast_jwt.decode(token, SECRET)
+
+
+def test_header_without_alg_is_rejected():
+    token = _forge({"typ": "JWT"}, {"sub": "user-1", "exp": _future()}, signature="c2ln")
+
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        fast_jwt.decode(token, SECRET)
+
+
+# -------------------------
+# Time claims
+# -------------------------
+def test_expired_token_is_rejected():
+    token = fast_jwt.encode({"sub": "user-1", "exp": int(time.time()) - 1}, SECRET)
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        fast_jwt.decode(token, SECRET)
+
+
+def test_not_yet_valid_token_is_rejected():
+    token = fast_jwt.encode({"sub": "user-1", "exp": _future(), "nbf": int(time.time()) + 300}, SECRET)
+
+    with pytest.raises(jwt.ImmatureSignatureError):
+        fast_jwt.decode(token, SECRET)
+
+
+@pytest.mark.parametrize("claim", ["exp", "nbf"])
+def test_non_numeric_time_claim_is_rejected(claim):
+    token = fast_jwt.encode({"sub": "user-1", claim: "tomorrow"}, SECRET)
+
+    with pytest.raises(jwt.DecodeError):
+        fast_jwt.decode(token, SECRET)
+
+
+# -------------------------
+# Malformed tokens
+# -------------------------
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "abc",
+        "abc.def",
+        "a.b.c.d",
+        "!!!.???.***",
+        "é.é.é",
+    ],
+)
+def test_malformed_segments_are_rejected(token):
+    with pytest.raises(jwt.DecodeError):
+        fast_jwt.decode(token, SECRET)
+
+
+def test_non_json_header_is_rejected():
+    valid = fast_jwt.encode({"sub": "user-1", "exp": _future()}, SECRET)
+    _, payload_segment, signature = valid.split(".")
+
+    with pytest.raises(jwt.DecodeError):
+        fast_jwt.decode(f"{_b64(b'not json')}.{payload_segment}.{signature}", SECRET)
+
+
+def test_non_object_payload_is_rejected():
+    signing_input = _b64(orjson.dumps({"alg": "HS256", "typ": "JWT"})) + "." + _b64(orjson.dumps([1, 2]))
+    signature = _b64(fast_jwt._sign(signing_input.encode("ascii"), SECRET))
+
+    with pytest.raises(jwt.DecodeError):
+        fast_jwt.decode(f"{signing_input}.{signature}", SECRET)
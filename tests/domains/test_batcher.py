@@ -0,0 +1,87 @@
+"""MicroBatcher: batch collection, concurrent batches and error propagation."""
+
+import asyncio
+
+import pytest
+
+from app.domains.ai_engine.batcher import MicroBatcher
+
+
+def test_concurrent_submits_are_grouped_up_to_max_batch():
+    batches = []
+
+    async def handler(items):
+        batches.append(items)
+
+    async def run():
+        batcher = MicroBatcher(handler, max_batch=3, max_wait=0.05)
+        try:
+            await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        finally:
+            await batcher.stop()
+
+    asyncio.run(run())
+
+    assert batches == [[0, 1, 2], [3, 4]]
+
+
+def test_slow_batch_does_not_block_the_next_one():
+    handled = []
+
+    async def run():
+        release_slow = asyncio.Event()
+
+        async def handler(items):
+            if items == ["slow"]:
+                await release_slow.wait()  # only released once the later batch has been handled
+            handled.extend(items)
+            if "fast" in items:
+                release_slow.set()
+
+        batcher = MicroBatcher(handler, max_batch=1, max_wait=0.0)
+        try:
+            slow = asyncio.create_task(batcher.submit("slow"))
+            await asyncio.sleep(0)
+            await asyncio.wait_for(batcher.submit("fast"), timeout=5)
+            await asyncio.wait_for(slow, timeout=5)
+        finally:
+            await batcher.stop()
+
+    asyncio.run(run())
+
+    assert handled == ["fast", "slow"]
+
+
+def test_handler_error_reaches_every_caller_in_the_batch():
+    async def handler(items):
+        raise RuntimeError("batch failed")
+
+    async def run():
+        batcher = MicroBatcher(handler, max_batch=2, max_wait=0.05)
+        try:
+            return await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(run())
+
+    assert [str(r) for r in results] == ["batch failed", "batch failed"]
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_stop_cancels_callers_of_running_batches():
+    async def run():
+        started = asyncio.Event()
+
+        async def handler(items):
+            started.set()
+            await asyncio.Event().wait()
+
+        batcher = MicroBatcher(handler, max_wait=0.0)
+        pending = asyncio.create_task(batcher.submit("x"))
+        await asyncio.wait_for(started.wait(), timeout=5)
+        await batcher.stop()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(pending, timeout=5)
+
+    asyncio.run(run())
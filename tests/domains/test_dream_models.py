@@ -0,0 +1,84 @@
+"""Loading stored dreams: typed analyses, and older free-form analyses that predate the schema."""
+
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+from pydantic import ValidationError
+
+from app.domains.ai_engine.services import _AnalysisOutput
+from app.domains.dreams.models import DreamAnalysis, DreamModel
+from app.domains.dreams.schemas import dreammodel_to_dto, serialize_dreams
+
+
+def _doc(analysis):
+    now = datetime.now(timezone.utc)
+    return {
+        "_id": ObjectId(),
+        "user_id": "user-1",
+        "timestamp": now,
+        "timezone": "UTC",
+        "text_content": "I was flying",
+        "audio_url": None,
+        "audio_duration_seconds": None,
+        "audio_transcript": None,
+        "language": "en",
+        "analysis": analysis,
+        "share_policy": None,
+        "status": "analyzed",
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def test_current_analysis_loads_typed():
+    analysis = {
+        "status": "complete",
+        "summary": "Flying over water",
+        "emotions": {"joy": 0.7},
+        "sentiment_score": 0.4,
+        "themes": ["freedom"],
+        "symbols": [{"symbol": "water", "confidence": 0.8, "explanation": "emotion"}],
+        "risk_flags": {"self_harm": "none", "suicide": "none", "violence": False, "abuse_mention": False},
+    }
+
+    dream = DreamModel.model_validate_doc(_doc(analysis))
+
+    assert isinstance(dream.analysis, DreamAnalysis)
+    assert dream.analysis.symbols[0].confidence == 0.8
+
+
+@pytest.mark.parametrize(
+    "legacy_analysis",
+    [
+        {"status": "complete", "symbols": [{"symbol": "water", "confidence": 1.5}]},
+        {"status": "complete", "symbols": ["water", "bridge"]},
+        {"status": "complete", "sentiment_score": -2},
+        {"summary": "free-form", "emotions": ["fear", "awe"], "risk_flags": "none"},
+    ],
+)
+def test_legacy_analysis_still_loads_and_serializes(legacy_analysis):
+    dream = DreamModel.model_validate_doc(_doc(legacy_analysis))
+
+    # Kept as stored (typed where it fits, raw dict otherwise) and still serializable
+    assert set(legacy_analysis) <= set(dream.model_dump_doc()["analysis"])
+    assert dreammodel_to_dto(dream).model_dump(by_alias=True)["analysis"] is not None
+    assert serialize_dreams([dream])
+
+
+def test_out_of_range_legacy_values_are_preserved():
+    dream = DreamModel.model_validate_doc(
+        _doc({"status": "complete", "sentiment_score": -2, "symbols": [{"symbol": "water", "confidence": 1.5}]})
+    )
+
+    assert dream.analysis.sentiment_score == -2
+    assert dream.analysis.symbols[0].confidence == 1.5
+
+
+def test_model_output_ranges_are_enforced():
+    with pytest.raises(ValidationError):
+        _AnalysisOutput.model_validate({"symbols": [{"symbol": "water", "confidence": 1.5}]})
+    with pytest.raises(ValidationError):
+        _AnalysisOutput.model_validate({"sentiment_score": -2})
+
+    assert _AnalysisOutput.model_validate({"sentiment_score": -1.0}).sentiment_score == -1.0
@@ -0,0 +1,77 @@
+"""analyze_dreams_batch: each dream is saved as soon as its own analysis finishes."""
+
+import asyncio
+
+import pytest
+
+from app.domains.dreams import services
+from app.domains.dreams.models import DreamAnalysis, DreamModel
+
+
+class FakeEngine:
+    def __init__(self, dreams, on_save):
+        self._dreams = dreams
+        self._on_save = on_save
+
+    async def find(self, model, query):
+        return self._dreams
+
+    async def save(self, dream):
+        await self._on_save(dream)
+        return dream
+
+
+@pytest.fixture
+def no_warm_up(monkeypatch):
+    async def warm_up_model():
+        return None
+
+    monkeypatch.setattr(services.ai_services, "warm_up_model", warm_up_model)
+
+
+def test_fast_dreams_are_saved_before_slow_one_finishes(monkeypatch, no_warm_up):
+    dreams = [DreamModel(user_id="u", text_content=text) for text in ("slow", "fast-1", "fast-2")]
+    saved = []
+
+    async def run():
+        release_slow = asyncio.Event()
+
+        async def analyze(text):
+            if text == "slow":
+                await release_slow.wait()  # only released once both fast dreams are saved
+            return DreamAnalysis(status="complete", summary=text)
+
+        async def on_save(dream):
+            saved.append(dream.text_content)
+            if {"fast-1", "fast-2"} <= set(saved):
+                release_slow.set()
+
+        monkeypatch.setattr(services.ai_services, "analyze_text_with_vertex", analyze)
+        monkeypatch.setattr(services, "get_engine", lambda: FakeEngine(dreams, on_save))
+        await asyncio.wait_for(services.analyze_dreams_batch([str(d.id) for d in dreams]), timeout=5)
+
+    asyncio.run(run())
+
+    assert saved[-1] == "slow"
+    assert sorted(saved) == ["fast-1", "fast-2", "slow"]
+    assert all(d.status == services.STATUS_ANALYZED for d in dreams)
+
+
+def test_save_error_is_raised_after_other_dreams_are_saved(monkeypatch, no_warm_up):
+    dreams = [DreamModel(user_id="u", text_content=text) for text in ("bad", "good")]
+    saved = []
+
+    async def analyze(text):
+        return DreamAnalysis(status="complete")
+
+    async def on_save(dream):
+        if dream.text_content == "bad":
+            raise RuntimeError("write failed")
+        saved.append(dream.text_content)
+
+    monkeypatch.setattr(services.ai_services, "analyze_text_with_vertex", analyze)
+    monkeypatch.setattr(services, "get_engine", lambda: FakeEngine(dreams, on_save))
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        asyncio.run(services.analyze_dreams_batch([str(d.id) for d in dreams]))
+    assert saved == ["good"]
@@ -0,0 +1,41 @@
+"""Loading stored users: the preferences subdocument keeps keys the schema doesn't know."""
+
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+from odmantic.exceptions import DocumentParsingError
+
+from app.domains.users.schemas import UserModel, usermodel_to_public_dict
+
+
+def _doc(preferences):
+    return {
+        "_id": ObjectId(),
+        "email": "dreamer@example.com",
+        "password_hash": "$argon2id$stub",
+        "roles": [],
+        "preferences": preferences,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def test_unknown_preference_keys_survive_load_and_save():
+    preferences = {"timezone": "UTC", "theme": "dark", "notifications": {"email": False}}
+
+    user = UserModel.model_validate_doc(_doc(preferences))
+
+    assert user.model_dump_doc()["preferences"] == preferences
+    assert usermodel_to_public_dict(user)["preferences"] == preferences
+
+
+def test_missing_preferences_stay_missing():
+    user = UserModel.model_validate_doc(_doc(None))
+
+    assert user.preferences is None
+    assert usermodel_to_public_dict(user)["preferences"] is None
+
+
+def test_known_preference_keys_are_type_checked():
+    with pytest.raises(DocumentParsingError):
+        UserModel.model_validate_doc(_doc({"notifications": {"email": "sometimes"}}))
@@ -0,0 +1,38 @@
+"""arq worker: analyze_dream jobs are batched, and a slow batch never holds back the next one."""
+
+import asyncio
+
+from app import worker
+
+
+def test_slow_batch_does_not_block_later_jobs(monkeypatch):
+    batches = []
+
+    async def run():
+        release_first = asyncio.Event()
+
+        async def analyze_dreams_batch(dream_ids):
+            batches.append(dream_ids)
+            if "first" in dream_ids:
+                await release_first.wait()  # only released once the later batch has finished
+            else:
+                release_first.set()
+
+        monkeypatch.setattr(worker, "analyze_dreams_batch", analyze_dreams_batch)
+        monkeypatch.setattr(worker, "ANALYSIS_BATCH_WAIT", 0.01)
+        ctx = {}
+        await worker.startup(ctx)
+        try:
+            first = asyncio.create_task(worker.analyze_dream(ctx, "first"))
+            await asyncio.sleep(0.05)  # let the first batch close and start
+            await asyncio.wait_for(
+                asyncio.gather(worker.analyze_dream(ctx, "second"), worker.analyze_dream(ctx, "third")),
+                timeout=5,
+            )
+            await asyncio.wait_for(first, timeout=5)
+        finally:
+            await ctx["dream_batches"].stop()
+
+    asyncio.run(run())
+
+    assert batches == [["first"], ["second", "third"]]